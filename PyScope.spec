@@ -5,14 +5,15 @@ a = Analysis(
     ['app.py'],
     pathex=[],
     binaries=[],
-    datas=[('icons', 'icons'), ('pyscope', 'pyscope')],
-    hiddenimports=[],
+    datas=[('icons', 'icons')],
+    hiddenimports=['pyscope.ui.main_window', 'pyscope.ui.dialogs'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['PIL', 'tkinter'],
     noarchive=False,
-    optimize=0,
+    module_collection_mode={'pyscope': 'pyz'},
+    optimize=2,
 )
 pyz = PYZ(a.pure)
 
@@ -4,102 +4,214 @@ Handles initialization, checks, and Windows multiprocessing.
 """
 import sys
 import multiprocessing
-import subprocess
-import traceback
 import os
 
-from PySide6.QtWidgets import QApplication, QMessageBox
-import PySide6.QtCore
-
 # Fix multiprocessing spawning on Windows frozen builds
 if sys.platform.startswith('win'):
     multiprocessing.freeze_support()
-    try:
-        multiprocessing.set_start_method('spawn', force=True)
-    except RuntimeError:
-        pass
-
-# Patch subprocess.run to hide console windows on Windows
-if sys.platform == 'win32':
-    _original_subprocess_run = subprocess.run
-    
-    def _patched_subprocess_run(*args, **kwargs):
-        """Hides console window for subprocess calls."""
-        if 'startupinfo' not in kwargs:
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            kwargs['startupinfo'] = startupinfo
-        if 'creationflags' not in kwargs:
-            kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-        return _original_subprocess_run(*args, **kwargs)
-    
-    subprocess.run = _patched_subprocess_run
-
-# Resolve base directory (frozen vs source)
-if getattr(sys, 'frozen', False):
-    current_dir = os.path.dirname(sys.executable)
-else:
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-
-# Ensure project root is in path
-if current_dir not in sys.path:
+    # spawn is already the Windows default; never force it after freeze_support()
+    if multiprocessing.get_start_method(allow_none=True) != 'spawn':
+        try:
+            multiprocessing.set_start_method('spawn')
+        except RuntimeError:
+            pass
+
+# Resolve base directory (frozen vs source); both paths are already absolute
+current_dir = os.path.dirname(sys.executable if getattr(sys, 'frozen', False) else __file__)
+
+# Ensure project root leads the path; the script dir is usually already sys.path[0]
+if not sys.path or sys.path[0] != current_dir:
     sys.path.insert(0, current_dir)
 
+# Set when running under a test harness that may already own a QApplication
+_EMBEDDED = "PYTEST_CURRENT_TEST" in os.environ
+
+# Modules first needed on user interaction (details, updates, search)
+_PREWARM_MODULES = ("pyscope.ui.dialogs", "importlib.metadata", "packaging.version")
+
+
+def _prewarm_imports():
+    """Import modules needed later on a background thread after first paint."""
+    import importlib
+    import threading
+    
+    def worker():
+        for name in _PREWARM_MODULES:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass
+        # Parse installed METADATA (pulls in the email parsers) before the first details view
+        try:
+            from pyscope.ui.dialogs import prewarm_dependency_index
+            prewarm_dependency_index()
+        except Exception as e:
+            from pyscope.utils import logger
+            logger.debug("Dependency index prewarm failed: %s", e)
+    
+    threading.Thread(target=worker, daemon=True, name="pyscope-prewarm").start()
+
+
+def _import_ui():
+    """Import the main window and pre-decode its icons (runs off the GUI thread)."""
+    import pyscope.ui.main_window
+    from pyscope.ui.dialogs import preload_icons
+    preload_icons()
+
+
+def _maybe_profile_imports():
+    """Re-run under ``-X importtime`` when PYSCOPE_IMPORTTIME is set (source runs only).
+
+    The trace is written to the file named by PYSCOPE_IMPORTTIME_LOG
+    (default ``importtime.log``); see tools/analyze_importtime.py.
+    """
+    if not os.environ.get("PYSCOPE_IMPORTTIME") or getattr(sys, 'frozen', False):
+        return
+    import subprocess
+    env = dict(os.environ)
+    env.pop("PYSCOPE_IMPORTTIME")
+    log_path = env.pop("PYSCOPE_IMPORTTIME_LOG", "importtime.log")
+    with open(log_path, "w", encoding="utf-8") as log:
+        cmd = [sys.executable, "-X", "importtime", os.path.abspath(sys.argv[0])] + sys.argv[1:]
+        sys.exit(subprocess.call(cmd, stderr=log, env=env))
+
+
+def _on_health_checked(detector, splash, health) -> bool:
+    """Handle the health check result on the Qt main thread. Returns False on critical failure."""
+    if health["status"] != "CRITICAL":
+        return True
+    
+    error_details = []
+    if not health["details"].get("python_valid"):
+        error_details.append("❌ No valid Python interpreter found")
+    if not health["details"].get("pip_available"):
+        error_details.append("❌ pip is not available")
+    if health["details"].get("python_error"):
+        error_details.append(f"Error: {health['details']['python_error']}")
+    
+    error_msg = "\n".join(error_details) if error_details else "Unknown critical error"
+    detector.logger.critical("Health check FAILED:\n%s", error_msg)
+    
+    from PySide6.QtWidgets import QApplication, QMessageBox
+    splash.close()
+    QMessageBox.critical(
+        None, "PyScope - Critical Error",
+        f"System check failed:\n\n{error_msg}\nCheck logs for details."
+    )
+    QApplication.exit(1)
+    return False
+
+
+def _install_excepthook(detector):
+    """Log uncaught errors; until startup completes, also report them and quit.
+
+    Returns a callable that ends the startup phase. After it runs, errors
+    raised from slots are logged and printed and the event loop keeps going.
+    """
+    starting = True
+    
+    def hook(exctype, value, tb):
+        if not starting:
+            detector.logger.error("Uncaught error: %s", value, exc_info=(exctype, value, tb))
+            sys.__excepthook__(exctype, value, tb)
+            return
+        detector.logger.critical("FATAL ERROR: %s", value, exc_info=(exctype, value, tb))
+        # Only touch Qt if it was already loaded before the failure
+        if 'PySide6.QtWidgets' in sys.modules:
+            from PySide6.QtWidgets import QApplication, QMessageBox
+            if QApplication.instance():
+                QMessageBox.critical(None, "PyScope - Fatal Error", f"App failed to start:\n\n{value}")
+                # Startup slots (health check, window creation) run inside the event loop
+                QApplication.exit(1)
+    
+    def startup_done():
+        nonlocal starting
+        starting = False
+    
+    sys.excepthook = hook
+    return startup_done
+
 
 def main():
     """Application entry point."""
-    try:
-        from pyscope.system import get_detector
-        detector = get_detector("PyScope")
-        
-        # Health Check
-        detector.logger.info("Performing system health check...")
-        health = detector.check_health()
-        
-        # Init Application
-        app = QApplication.instance() or QApplication(sys.argv)
-        app.setApplicationName("PyScope")
-        app.setApplicationDisplayName("PyScope Package Manager")
-        
-        # Handle Critical Failures
-        if health["status"] == "CRITICAL":
-            error_details = []
-            if not health["details"].get("python_valid"):
-                error_details.append("❌ No valid Python interpreter found")
-            if not health["details"].get("pip_available"):
-                error_details.append("❌ pip is not available")
-            if health["details"].get("python_error"):
-                error_details.append(f"Error: {health['details']['python_error']}")
-            
-            error_msg = "\n".join(error_details) if error_details else "Unknown critical error"
-            detector.logger.critical(f"Health check FAILED:\n{error_msg}")
-            
-            QMessageBox.critical(
-                None, "PyScope - Critical Error",
-                f"System check failed:\n\n{error_msg}\nCheck logs for details."
-            )
-            sys.exit(1)
-        
-        # Load Theme
-        from pyscope.ui import QtTheme
-        theme = QtTheme()
-        theme.apply_to_app(app)
+    _maybe_profile_imports()
+    from pyscope.system import get_detector
+    detector = get_detector("PyScope")
+    startup_done = _install_excepthook(detector)
+    
+    # Import the main window module and decode its icons while Qt starts
+    # and the health probe runs
+    import threading
+    ui_import = threading.Thread(target=_import_ui, daemon=True, name="pyscope-ui-import")
+    ui_import.start()
+    
+    # Qt is only needed once the detector is up
+    from PySide6.QtWidgets import QApplication, QSplashScreen
+    from PySide6.QtCore import Qt, QTimer, QSize
+    from PySide6.QtGui import QPixmap, QImageReader, QIcon
+    
+    # Init Application
+    # Fusion is set before construction so Qt never builds the native style
+    QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents)
+    QApplication.setStyle("Fusion")
+    # An existing instance is only possible when embedded (e.g. pytest-qt)
+    app = QApplication.instance() if _EMBEDDED else None
+    if app is None:
+        app = QApplication(sys.argv)
+    app.setApplicationName("PyScope")
+    app.setApplicationDisplayName("PyScope Package Manager")
+    
+    # Splash is painted while the health probe runs
+    # The reader scales while decoding, so no full-size pixmap is ever built
+    reader = QImageReader(detector.get_resource_path(os.path.join("icons", "logo.png")))
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(size.scaled(QSize(256, 256), Qt.KeepAspectRatio))
+    logo = QPixmap.fromImage(reader.read())
+    if not logo.isNull():
+        # Reuse the decoded logo as the app-wide icon instead of loading it again
+        app.setWindowIcon(QIcon(logo))
+    splash = QSplashScreen(logo)
+    splash.show()
+    app.processEvents()
+    
+    window = None
+    
+    def on_health(health):
+        nonlocal window
+        if not _on_health_checked(detector, splash, health):
+            return
         
         # Launch GUI
         detector.logger.info("Launching Main Window")
-        from pyscope.ui import MainWindow
         window = MainWindow()
         window.show()
-        
-        sys.exit(app.exec())
-        
-    except Exception as e:
-        print(f"FATAL ERROR: {e}")
-        traceback.print_exc()
-        if QApplication.instance():
-             QMessageBox.critical(None, "PyScope - Fatal Error", f"App failed to start:\n\n{e}")
-        sys.exit(1)
+        splash.finish(window)
+        startup_done()
+        QTimer.singleShot(0, _prewarm_imports)
+    
+    def on_health_error(error):
+        detector.logger.error("Health check error: %s", error)
+        on_health({"status": "UNKNOWN", "details": {}})
+    
+    # Health Check (background, result delivered on the main thread)
+    from pyscope.ui.dialogs import GenericWorker
+    detector.logger.info("Performing system health check...")
+    health_worker = GenericWorker(detector.check_health)
+    health_worker.finished.connect(on_health)
+    health_worker.error.connect(on_health_error)
+    health_worker.start()
+    
+    # Load Theme (a failed background import is retried and raised here)
+    ui_import.join()
+    from pyscope.ui import QtTheme, MainWindow
+    theme = QtTheme()
+    theme.apply_to_app(app)
+    
+    exit_code = app.exec()
+    health_worker.wait()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,27 +1,102 @@
 """PyScope:https://github.com/Limitless-Soul1/PyScope"""
 
+import subprocess
 import threading
-import urllib.request
 import urllib.parse
-import urllib.error
-import json
+import http.client
 import time
 import re
 import os
 import ssl
 import sys
-import subprocess
 from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
-from datetime import datetime, timedelta
-from contextlib import closing
 from typing import List, Dict
 from collections import OrderedDict
 
-from .utils import logger, run_pip_with_real_progress
+from .utils import logger, run_pip_with_real_progress, run_hidden, VersionComparator, json_loads
 from .system import get_detector
 
 detector = get_detector()
 
+# PEP 503 name normalization (pip show reports the canonical project name)
+_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
+_PYPI_HOST = "pypi.org"
+_PYPI_HEADERS = {'User-Agent': 'PyScope'}
+
+# Run by a target interpreter to list its distributions as [[name, version], ...].
+# Reads Name/Version headers like _dist_name_version, and keeps the first
+# distribution per normalized name on sys.path (the one pip list reports).
+_LIST_DISTRIBUTIONS_SCRIPT = """\
+import json, re, importlib.metadata as m
+def name_version(d):
+    path = getattr(d, "_path", None)
+    if path is not None:
+        name = version = None
+        try:
+            with open(path / ("METADATA" if path.suffix == ".dist-info" else "PKG-INFO"), encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    if line.startswith("Name:"):
+                        name = line[5:].strip()
+                    elif line.startswith("Version:"):
+                        version = line[8:].strip()
+                    elif not line.strip():
+                        break
+                    if name and version:
+                        return name, version
+        except OSError:
+            pass
+    md = d.metadata
+    return md.get("Name"), md.get("Version")
+out = []
+seen = set()
+for d in m.distributions():
+    try:
+        name, version = name_version(d)
+    except Exception:
+        continue
+    key = re.sub(r"[-_.]+", "-", name or "").lower()
+    if key and key not in seen:
+        seen.add(key)
+        out.append([name, version])
+print(json.dumps(out))
+"""
+
+# Seconds before a package with a known status is checked again (monotonic clock)
+_RECHECK_INTERVAL = 30.0
+
+# Name and version spans of pypi.org search result snippets
+_SNIPPET_SPAN_RE = re.compile(
+    r'<span[^>]*class="[^"]*package-snippet__(name|version)[^"]*"[^>]*>([^<]{1,100})</span>'
+)
+
+def _dist_name_version(dist):
+    """(Name, Version) of a distribution from the top of its metadata file.
+
+    Reads header lines only and stops once both are found, instead of having
+    dist.metadata run the email parser over the whole file (long descriptions
+    included). Falls back to dist.metadata for layouts without a readable file.
+    """
+    path = getattr(dist, "_path", None)
+    if path is not None:
+        name = version = None
+        try:
+            with open(path / ("METADATA" if path.suffix == ".dist-info" else "PKG-INFO"), encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    if line.startswith("Name:"):
+                        name = line[5:].strip()
+                    elif line.startswith("Version:"):
+                        version = line[8:].strip()
+                    elif not line.strip():
+                        break  # End of the header block
+                    if name and version:
+                        return name, version
+        except OSError:
+            pass
+    metadata = dist.metadata
+    return metadata.get("Name"), metadata.get("Version")
+
+
 class PackageManagerCore:
     """Core package management with thread safety, rate limiting, and caching."""
     
@@ -32,29 +107,56 @@ class PackageManagerCore:
         
         self.packages: list = []
         self.checking = False
+        # Bumped on every change to self.packages so readers can skip re-copying
+        self.data_version = 0
+        # Cache tuples of packages changed since the last cache save
+        self._cache_dirty = {}
+        # {name: package} and {lowercase name: package} over self.packages, see _package_index
+        self._packages_by_name = {}
+        self._packages_by_lower = {}
+        self._packages_by_name_src = None
         
         # Generation counter for load requests (Prevents race conditions)
         self._load_generation = 0
         self._load_gen_lock = threading.Lock()
         
-        self.last_check_time = {}
+        self.last_check_time = {}  # name -> time.monotonic() of the last check
         self.request_failures = {}
         
         # LRU cache implementation
         self._search_cache = OrderedDict()
-        self._search_cache_ttl = timedelta(minutes=5)
+        self._search_cache_ttl = 300.0  # seconds, against time.monotonic() stamps
         self._search_cache_max_size = 100
         
         self._packages_cache = OrderedDict()
-        self._cache_expiry = timedelta(hours=1)
+        self._cache_expiry = 3600.0  # seconds, against time.monotonic() stamps
         self._packages_cache_max_size = 20
         
-        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pyscope")
+        # Update-check fan-out: each worker keeps its own PyPI connection alive (see _pypi_get),
+        # so this is the number of requests in flight; threads are only started as needed
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="pyscope")
+        # UI-initiated work (load, search, single checks, pip install/uninstall) reuses these workers
+        self._task_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="pyscope-task")
+        
+        # Concurrent `pip show` version lookups, grouped per pip command
+        self._version_batches = {}
+        self._version_batch_lock = threading.Lock()
+        self._version_query_lock = threading.Lock()
 
         # Security limits
         self.MAX_SEARCH_LENGTH = 100
         self.MAX_JSON_SIZE = 50_000_000
         
+        # One kept-alive HTTPS connection to PyPI per worker thread (see _pypi_get);
+        # they share one SSL context so the CA bundle is loaded once
+        self._http_local = threading.local()
+        self._http_connections = []
+        self._ssl_context = None
+        self._version_comparator = VersionComparator()
+        # Simple-index validators (LRU): name -> (ETag, latest version) for conditional re-checks
+        self._simple_etags = OrderedDict()
+        self._simple_etags_max_size = 2000
+        
         # Environment support
         self.pip_command = None
         
@@ -67,11 +169,8 @@ class PackageManagerCore:
         self._consecutive_failures_threshold = 10
         
         # Performance parameters
-        self._check_delay = 0.1
-        self._update_batch = []
-        self._batch_lock = threading.RLock()
-        self._last_batch_update = 0
-        self._batch_update_interval = 0.3
+        # Cap on concurrent PyPI requests across the check and task pools (held per request only)
+        self._pypi_slots = threading.BoundedSemaphore(16)
         self._thread_semaphore = threading.Semaphore(4)
         
         self.signals = None
@@ -84,14 +183,9 @@ class PackageManagerCore:
     def _start_background_saver(self):
         """Background thread to save package cache."""
         def saver_loop():
-            while not self._shutting_down.is_set():
-                for _ in range(60): 
-                    if self._shutting_down.is_set(): return
-                    time.sleep(1)
-                
-                with self.lock:
-                    if self.current_environment_id and self.packages:
-                        self._save_packages_to_cache(self.current_environment_id, self.packages)
+            # Event.wait wakes immediately on shutdown instead of polling every second
+            while not self._shutting_down.wait(60):
+                self._flush_cache_updates()
         
         threading.Thread(target=saver_loop, daemon=True, name="pyscope-saver").start()
 
@@ -111,15 +205,59 @@ class PackageManagerCore:
             
             try:
                 self._executor.shutdown(wait=False)
+                self._task_executor.shutdown(wait=False, cancel_futures=True)
             except Exception as e:
-                logger.warning(f"Shutdown error: {e}")
+                logger.warning("Shutdown error: %s", e)
+        
+        with self.lock:
+            connections, self._http_connections = self._http_connections, []
+        for conn in connections:
+            try: conn.close()
+            except Exception: pass
                 
         logger.info("PackageManagerCore shutdown complete")
 
-    def _trim_cache(self, cache: OrderedDict, max_size: int):
-        """Trim cache to maintain maximum size limit."""
-        while len(cache) > max_size:
-            cache.popitem(last=False)
+    def _submit_task(self, fn):
+        """Run a background task on the shared task pool."""
+        try:
+            return self._task_executor.submit(fn)
+        except RuntimeError:
+            # Pool already shut down
+            logger.info("Shutting down, task not started")
+            return None
+
+    def _package_index(self, lowercase: bool = False) -> Dict[str, dict]:
+        """{name: package dict} (or keyed by lowercase name) for self.packages (call with self.lock held).
+
+        Rebuilt after _mark_packages_changed(structural=True); in-place
+        field updates keep the same dicts, so the index stays valid.
+        """
+        packages = self.packages
+        if self._packages_by_name_src is not packages:
+            # First entry wins, as the old linear scans did; both keep the list's order
+            by_name = {}
+            by_lower = {}
+            for p in packages:
+                by_name.setdefault(p["name"], p)
+                by_lower.setdefault(p["name"].lower(), p)
+            self._packages_by_name = by_name
+            self._packages_by_lower = by_lower
+            self._packages_by_name_src = packages
+        return self._packages_by_lower if lowercase else self._packages_by_name
+
+    def _mark_packages_changed(self, pkg=None, structural=False):
+        """Record a change to self.packages (call with self.lock held).
+
+        Pass the changed package to queue just that entry for the next cache flush.
+        Pass structural=True when entries were added, removed or the list replaced.
+        """
+        self.data_version += 1
+        if structural:
+            self._packages_by_name_src = None
+        if pkg is not None:
+            self._cache_dirty[pkg["name"].lower()] = (
+                pkg.get("ver", "Unknown"), pkg.get("lat", "Unknown"), pkg.get("stat", "Unknown")
+            )
 
     def check_updates(self, ui_start_callback=None, ui_finish_callback=None, ui_package_callback=None):
         """Check for updates for all installed packages."""
@@ -167,7 +305,7 @@ class PackageManagerCore:
         except Exception as e:
             with self.lock:
                 self.checking = False
-            logger.error(f"Check error: {e}")
+            logger.error("Check error: %s", e)
 
     def _check_updates_safe_parallel(self, ui_finish_callback, ui_package_callback=None):
         """Parallel update checking with failure protection."""
@@ -189,33 +327,22 @@ class PackageManagerCore:
             
             global_timeout = 300
             start_time = time.time()
-            max_workers = 4
             
-            logger.info(f"Starting parallel update check for {total} packages")
-            import threading
-            logger.info(f"Active threads before check: {threading.active_count()}")
+            logger.info("Starting parallel update check for %s packages", total)
+            logger.info("Active threads before check: %s", threading.active_count())
             
             # Limit pending tasks
             task_semaphore = threading.Semaphore(50)
             
-            # Reset batch system
-            with self._batch_lock:
-                self._update_batch = []
-                self._last_batch_update = time.time()
-            
             # Use persistent executor
             future_to_package = {}
             active_futures = []
             
-            for idx, (pkg_name, pkg_ver) in enumerate(packages_to_check):
+            for pkg_name, pkg_ver in packages_to_check:
                 if self._shutting_down.is_set() or self._check_cancelled.is_set():
                     logger.info("Update check cancelled during task submission")
                     break
                 
-                # Sleep less frequently for faster overall checks
-                if idx % 10 == 0 and idx > 0:
-                    time.sleep(self._check_delay)  # Removed *3 multiplier
-                
                 # Acquire semaphore (blocks if too many tasks are pending)
                 task_semaphore.acquire()
                 
@@ -253,7 +380,7 @@ class PackageManagerCore:
                 except Exception as e:
                     if not submitted:
                         task_semaphore.release()
-                    logger.error(f"Failed to submit task or register callback: {e}")
+                    logger.error("Failed to submit task or register callback: %s", e)
                     if isinstance(e, RuntimeError):
                         break
             
@@ -276,54 +403,32 @@ class PackageManagerCore:
                         with self._failures_lock:
                             self._consecutive_failures += 1
                         
-                        logger.warning(f"Package check failed: {e}")
+                        logger.warning("Package check failed: %s", e)
                         
                         if self._consecutive_failures >= self._consecutive_failures_threshold:
-                            logger.error(f"Stopping update check due to consecutive failures")
+                            logger.error("Stopping update check due to consecutive failures")
                             # Cancel remaining
                             for f in active_futures:
                                 f.cancel()
                             break
                 
             except TimeoutError:
-                logger.warning(f"Global timeout reached for update check")
+                logger.warning("Global timeout reached for update check")
             except Exception as e:
-                logger.error(f"Error in parallel update check: {e}")
-
-            
-            # Flush any remaining batch updates
-            self._flush_batch_updates(ui_package_callback)
+                logger.error("Error in parallel update check: %s", e)
         
         except Exception as e:
-            logger.error(f"Parallel update thread error: {e}")
+            logger.error("Parallel update thread error: %s", e)
         finally:
             with self.lock:
                 self.checking = False
-                if self.current_environment_id and not self._shutting_down.is_set():
-                    self._save_packages_to_cache(self.current_environment_id, self.packages)
-            
-            # CRITICAL: Flush any remaining batch updates BEFORE calling finish callback
-            # This ensures all status updates are visible before "completed" message
-            self._flush_batch_updates(ui_package_callback)
+                if not self._shutting_down.is_set():
+                    self._flush_cache_updates()
             
-            logger.info(f"Update check finished (cleanup). Time: {time.time() - start_time:.2f}s")
+            logger.info("Update check finished (cleanup). Time: %.2fs", time.time() - start_time)
             if not self._shutting_down.is_set() and ui_finish_callback:
                 ui_finish_callback()
 
-    def _flush_batch_updates(self, ui_package_callback):
-        """Flush pending batch updates to UI."""
-        if not ui_package_callback:
-            return
-        
-        with self._batch_lock:
-            if self._update_batch:
-                try:
-                    for pkg_name in self._update_batch:
-                        ui_package_callback(pkg_name)
-                    self._update_batch.clear()
-                except Exception as e:
-                    logger.error(f"Error flushing batch updates: {e}")
-
     def check_single_package(self, pkg_name: str, callback=None):
         """Check a single package for updates."""
         if self._shutting_down.is_set():
@@ -333,40 +438,22 @@ class PackageManagerCore:
         
         def check_task():
             try:
-                logger.info(f"Checking single package task: {pkg_name}")
+                logger.info("Checking single package task: %s", pkg_name)
                 
                 with self.lock:
-                    package_info = None
-                    current_version = "Unknown"
-                    for p in self.packages:
-                        if p["name"] == pkg_name:
-                            package_info = p.copy()
-                            current_version = p.get("ver", "Unknown")
-                            break
+                    p = self._package_index().get(pkg_name)
+                    known = p is not None
+                    current_version = p.get("ver", "Unknown") if known else "Unknown"
                 
-                if not package_info:
-                    # Try to discover it via pip show in TARGET environment
+                if not known:
+                    # Try to discover it in TARGET environment
                     try:
-                        cmd = self.pip_command + ["show", pkg_name]
-                        # Safe subprocess execution
-                        result = subprocess.run(
-                            cmd, 
-                            capture_output=True, 
-                            text=True, 
-                            timeout=5,
-                            encoding='utf-8', 
-                            errors='replace'
-                        )
+                        discovered = self._get_installed_version(pkg_name, self.get_pip_command(), timeout=5)
                         
-                        if result.returncode == 0:
-                            current_version = "Unknown"
-                            # Parse version from output
-                            for line in result.stdout.splitlines():
-                                if line.startswith("Version:"):
-                                    current_version = line.split(":", 1)[1].strip()
-                                    break
+                        if discovered is not None:
+                            current_version = discovered or "Unknown"
                             
-                            logger.info(f"Discovered new package {pkg_name} v{current_version} in target env")
+                            logger.info("Discovered new package %s v%s in target env", pkg_name, current_version)
                             with self.lock:
                                 new_pkg = {
                                     "name": pkg_name, 
@@ -375,36 +462,35 @@ class PackageManagerCore:
                                     "stat": "Unknown"
                                 }
                                 # Check again in case race condition added it
-                                if not any(p["name"] == pkg_name for p in self.packages):
+                                if pkg_name not in self._package_index():
                                     self.packages.append(new_pkg)
                                     self.packages.sort(key=lambda x: x["name"].lower())
-                                package_info = new_pkg
+                                    self._mark_packages_changed(new_pkg, structural=True)
                         else:
-                             logger.warning(f"Package {pkg_name} not found via pip show")
+                             logger.warning("Package %s not found in target env", pkg_name)
                              if callback:
                                  callback(False, f"Package {pkg_name} not found in target environment")
                              return
 
                     except Exception as e:
-                        logger.warning(f"Package discovery failed for {pkg_name}: {e}")
+                        logger.warning("Package discovery failed for %s: %s", pkg_name, e)
                         if callback:
                             callback(False, f"Error verifying package {pkg_name}: {e}")
                         return
                 
                 # Force check since this is a manual user request
-                logger.info(f"Calling _check_single_package_simple for {pkg_name}...")
-                success = self._check_single_package_simple(pkg_name, current_version, None, force=True)
-                logger.info(f"_check_single_package_simple returned {success}")
+                logger.info("Calling _check_single_package_simple for %s...", pkg_name)
+                # package_updated is emitted through the callback, as on the full-check path
+                emit_updated = self.signals.package_updated.emit if self.signals else None
+                success = self._check_single_package_simple(pkg_name, current_version, emit_updated, force=True)
+                logger.info("_check_single_package_simple returned %s", success)
                 
                 with self.lock:
-                    updated_info = None
-                    for p in self.packages:
-                        if p["name"] == pkg_name:
-                            updated_info = p.copy()
-                            break
+                    p = self._package_index().get(pkg_name)
+                    updated_info = p.copy() if p is not None else None
                 
                 if updated_info:
-                    logger.info(f"Single package check completed for {pkg_name}: {updated_info['stat']}")
+                    logger.info("Single package check completed for %s: %s", pkg_name, updated_info['stat'])
                     if callback:
                         if success:
                             logger.info("Calling success callback...")
@@ -412,26 +498,160 @@ class PackageManagerCore:
                         else:
                             callback(False, f"Failed to fetch latest version for {pkg_name}")
                 else:
-                    logger.error(f"Failed to get updated info for {pkg_name}")
+                    logger.error("Failed to get updated info for %s", pkg_name)
                     if callback:
                         callback(False, "Failed to update package information")
                         
             except Exception as e:
-                logger.error(f"Error checking single package {pkg_name}: {e}")
+                logger.error("Error checking single package %s: %s", pkg_name, e)
                 if callback:
                     callback(False, str(e))
         
         # Run with semaphore control
         def task_with_semaphore():
-            logger.info(f"Wait for semaphore for {pkg_name}...")
+            logger.info("Wait for semaphore for %s...", pkg_name)
             with self._thread_semaphore:
-                logger.info(f"Acquired semaphore for {pkg_name}, starting checks...")
+                logger.info("Acquired semaphore for %s, starting checks...", pkg_name)
                 check_task()
-                logger.info(f"Released semaphore for {pkg_name}")
+                logger.info("Released semaphore for %s", pkg_name)
+        
+        self._submit_task(task_with_semaphore)
+        logger.info("Queued check for %s", pkg_name)
+
+    def _pypi_connection(self):
+        """This thread's HTTPS connection to PyPI, opened on first use and then kept alive."""
+        conn = getattr(self._http_local, "conn", None)
+        if conn is None:
+            with self.lock:
+                if self._ssl_context is None:
+                    self._ssl_context = ssl.create_default_context()
+                conn = http.client.HTTPSConnection(_PYPI_HOST, timeout=10, context=self._ssl_context)
+                self._http_connections.append(conn)
+            self._http_local.conn = conn
+        return conn
+
+    def _drop_pypi_connection(self, conn):
+        conn.close()
+        self._http_local.conn = None
+        with self.lock:
+            try: self._http_connections.remove(conn)
+            except ValueError: pass
+
+    def _pypi_get(self, path: str, headers=None, limit=None):
+        """GET a path on PyPI, reusing the thread's connection.
+
+        Returns (status, response headers, body). Same-host redirects are
+        followed; the body is truncated to `limit` bytes when one is given.
+        Raises OSError / http.client.HTTPException on network failure.
+        """
+        req_headers = {**_PYPI_HEADERS, **headers} if headers else _PYPI_HEADERS
+        for _ in range(4):
+            for attempt in range(2):
+                conn = self._pypi_connection()
+                try:
+                    with self._pypi_slots:
+                        conn.request("GET", path, headers=req_headers)
+                        response = conn.getresponse()
+                        body = response.read(limit) if limit else response.read()
+                    break
+                except (http.client.HTTPException, OSError):
+                    self._drop_pypi_connection(conn)
+                    # A kept-alive socket may have been closed by the server; retry once on a fresh one
+                    if attempt:
+                        raise
+            if not response.isclosed() or response.will_close:
+                # Unread body (over the limit) or server asked to close: the socket cannot be reused
+                self._drop_pypi_connection(conn)
+            location = response.getheader("Location")
+            if response.status in (301, 302, 303, 307, 308) and location:
+                parsed = urllib.parse.urlsplit(location)
+                if parsed.netloc in ("", _PYPI_HOST):
+                    path = urllib.parse.urlunsplit(("", "", parsed.path, parsed.query, ""))
+                    continue
+            return response.status, response.headers, body
+        return response.status, response.headers, body
+
+    def _fetch_latest_via_simple(self, pkg_name: str):
+        """Latest version from PyPI's JSON simple index, revalidated with ETags.
+
+        Returns "Unknown" for projects PyPI does not know and None when the
+        index cannot answer (caller falls back to _fetch_package_info).
+        """
+        if self._shutting_down.is_set() or self._check_cancelled.is_set():
+            return "Unknown"
+        key = self._normalize_name(pkg_name)
+        with self.lock:
+            cached = self._simple_etags.get(key)
+            if cached:
+                self._simple_etags.move_to_end(key)
+        headers = {'Accept': 'application/vnd.pypi.simple.v1+json'}
+        if cached:
+            headers['If-None-Match'] = cached[0]
+        try:
+            status, response_headers, raw = self._pypi_get(f"/simple/{key}/", headers=headers, limit=self.MAX_JSON_SIZE + 1)
+        except Exception as e:
+            logger.debug("Simple index request failed for %s: %s", pkg_name, e)
+            return None
+        if status == 304 and cached:
+            return cached[1]
+        if status == 404:
+            return "Unknown"
+        if status != 200 or len(raw) > self.MAX_JSON_SIZE:
+            return None
+        try:
+            latest = self._latest_simple_version(json_loads(raw))
+        except Exception as e:
+            logger.debug("Simple index parse failed for %s: %s", pkg_name, e)
+            return None
+        if latest is None:
+            return None
+        etag = response_headers.get("ETag")
+        if etag:
+            with self.lock:
+                if key in self._simple_etags:
+                    self._simple_etags.move_to_end(key)
+                elif len(self._simple_etags) >= self._simple_etags_max_size:
+                    self._simple_etags.popitem(last=False)
+                self._simple_etags[key] = (etag, latest)
+        return latest
+
+    @staticmethod
+    def _latest_simple_version(data: dict):
+        """Highest non-yanked release in a simple-index response (pre-releases only if nothing else)."""
+        from packaging.version import Version, InvalidVersion
+        files = data.get("files", [])
+        yanked = set()
+        if any(f.get("yanked") for f in files):
+            # A version counts as yanked only when every one of its files is
+            from packaging.utils import parse_wheel_filename, parse_sdist_filename
+            live = set()
+            for f in files:
+                filename = f.get("filename", "")
+                try:
+                    if filename.endswith(".whl"):
+                        version = parse_wheel_filename(filename)[1]
+                    else:
+                        version = parse_sdist_filename(filename)[1]
+                except Exception:
+                    continue
+                (yanked if f.get("yanked") else live).add(version)
+            yanked -= live
         
-        t = threading.Thread(target=task_with_semaphore, daemon=True)
-        t.start()
-        logger.info(f"Started thread for {pkg_name}")
+        best = best_pre = None
+        for raw_version in data.get("versions", ()):
+            try:
+                version = Version(raw_version)
+            except InvalidVersion:
+                continue
+            if version in yanked:
+                continue
+            if version.is_prerelease:
+                if best_pre is None or version > best_pre[0]:
+                    best_pre = (version, raw_version)
+            elif best is None or version > best[0]:
+                best = (version, raw_version)
+        best = best or best_pre
+        return best[1] if best else None
 
     def _fetch_package_info(self, pkg_name: str):
         """Fetch package information from PyPI with retry logic."""
@@ -442,39 +662,30 @@ class PackageManagerCore:
                 return "Unknown"
                 
             try:
-                url = f"https://pypi.org/pypi/{pkg_name}/json"
-                req = urllib.request.Request(url, headers={'User-Agent': 'PyScope'})
+                # Read only first 50MB to prevent DoS
+                status, _, raw = self._pypi_get(f"/pypi/{pkg_name}/json", limit=50_000_000)
                 
-                context = ssl.create_default_context()
-                # Enforce size limit with explicit read
-                with closing(urllib.request.urlopen(req, timeout=10, context=context)) as response:
-                    # Read only first 50MB to prevent DoS
-                    raw = response.read(50_000_000) 
-                    
-                    if len(raw) >= 50_000_000:
-                        raise ValueError("Response too large")
-
-                    
-                    data = json.loads(raw)
-                    info = data.get("info", {})
-                    return info.get("version", "Unknown")
-                    
-            except urllib.error.HTTPError as e:
-                if e.code == 404:
+                if status == 404:
                     return "Unknown"
-                elif attempt < max_retries - 1:
-                    if self._shutting_down.is_set() or self._check_cancelled.is_set(): return "Unknown"
-                    time.sleep(1)
-                    continue
-                else:
+                if status != 200:
+                    if attempt < max_retries - 1:
+                        if self._shutting_down.wait(1) or self._check_cancelled.is_set(): return "Unknown"
+                        continue
                     return "Unknown"
+                
+                if len(raw) >= 50_000_000:
+                    raise ValueError("Response too large")
+                
+                data = json_loads(raw)
+                info = data.get("info", {})
+                return info.get("version", "Unknown")
+                    
             except Exception as e:
                 if attempt < max_retries - 1:
-                    if self._shutting_down.is_set() or self._check_cancelled.is_set(): return "Unknown"
-                    time.sleep(1)
+                    if self._shutting_down.wait(1) or self._check_cancelled.is_set(): return "Unknown"
                     continue
                 else:
-                    logger.warning(f"Failed to fetch package info for {pkg_name}: {e}")
+                    logger.warning("Failed to fetch package info for %s: %s", pkg_name, e)
                     return "Unknown"
         return "Unknown"
 
@@ -483,21 +694,17 @@ class PackageManagerCore:
         if self._shutting_down.is_set() or self._check_cancelled.is_set():
             return False
         
-        now = datetime.now()
-        
         # Rate limiting check (Skip if forced)
         if not force:
+            now = time.monotonic()
             with self.lock:
                 last_check = self.last_check_time.get(pkg_name)
                 # Find current status to allow retry if Unknown
-                current_status = "Unknown"
-                for p in self.packages:
-                    if p["name"] == pkg_name:
-                        current_status = p.get("stat", "Unknown")
-                        break
+                p = self._package_index().get(pkg_name)
+                current_status = p.get("stat", "Unknown") if p is not None else "Unknown"
                 
                 # Skip rate limiting check if status is Unknown (allow retry)
-                if current_status != "Unknown" and last_check and now - last_check < timedelta(seconds=30):
+                if current_status != "Unknown" and last_check and now - last_check < _RECHECK_INTERVAL:
                     if ui_package_callback:
                         try:
                             ui_package_callback(pkg_name)
@@ -506,38 +713,29 @@ class PackageManagerCore:
                 self.last_check_time[pkg_name] = now
         
         try:
-            time.sleep(self._check_delay)
-            
             # Fetch latest version from PyPI
-            latest = self._fetch_package_info(pkg_name)
+            latest = self._fetch_latest_via_simple(pkg_name) or self._fetch_package_info(pkg_name)
+            if self._check_cancelled.is_set():
+                # The fetchers answer "Unknown" once cancelled; keep the previous status
+                return False
             
             # Determine status
-            try:
-                from .utils import VersionComparator
-                comparator = VersionComparator()
-                
-                if latest == "Unknown" or latest == "Error":
-                    status = "Unknown"
-                elif comparator.is_outdated(pkg_ver, latest):
-                    status = "Outdated"
-                else:
-                    status = "Updated"
-            except ImportError:
-                # Fallback
+            if latest == "Unknown" or latest == "Error":
                 status = "Unknown"
-                if latest != "Unknown":
-                    # Simple normalization for fallback
-                    status = "Updated" if str(latest).strip().lower() == str(pkg_ver).strip().lower() else "Outdated"
+            elif self._version_comparator.is_outdated(pkg_ver, latest):
+                status = "Outdated"
+            else:
+                status = "Updated"
             
             # Update data before callback
             updated = False
             with self.lock:
-                for i, p in enumerate(self.packages):
-                    if p["name"] == pkg_name:
-                        self.packages[i]["lat"] = latest
-                        self.packages[i]["stat"] = status
-                        updated = True
-                        break
+                p = self._package_index().get(pkg_name)
+                if p is not None:
+                    p["lat"] = latest
+                    p["stat"] = status
+                    self._mark_packages_changed(p)
+                    updated = True
             
             # Call UI callback AFTER updating data
             if updated:
@@ -545,34 +743,28 @@ class PackageManagerCore:
                     try:
                         ui_package_callback(pkg_name)
                     except Exception as e:
-                        logger.error(f"Callback error for {pkg_name}: {e}")
-                
-                if self.signals:
-                    self.signals.package_updated.emit(pkg_name)
+                        logger.error("Callback error for %s: %s", pkg_name, e)
             
             return True
             
         except Exception as e:
-            logger.warning(f"Check failed for {pkg_name}: {e}")
+            logger.warning("Check failed for %s: %s", pkg_name, e)
             # Still update with error status
             updated = False
             with self.lock:
-                for i, p in enumerate(self.packages):
-                    if p["name"] == pkg_name:
-                        self.packages[i]["lat"] = "Error"
-                        self.packages[i]["stat"] = "Unknown"
-                        updated = True
-                        break
+                p = self._package_index().get(pkg_name)
+                if p is not None:
+                    p["lat"] = "Error"
+                    p["stat"] = "Unknown"
+                    self._mark_packages_changed(p)
+                    updated = True
             
             if updated:
                 if ui_package_callback:
                     try:
                         ui_package_callback(pkg_name)
                     except Exception as e:
-                        logger.error(f"Callback error for {pkg_name}: {e}")
-                
-                if self.signals:
-                    self.signals.package_updated.emit(pkg_name)
+                        logger.error("Callback error for %s: %s", pkg_name, e)
             
             return False
 
@@ -582,12 +774,16 @@ class PackageManagerCore:
         self._check_cancelled.set()
         with self.lock:
             self.checking = False
+            # Drop queued checks now rather than letting each worker pick one up just to bail out
+            for future in list(getattr(self, '_active_futures', ())):
+                future.cancel()
         logger.info("Update check cancelled")
     
     def clear_all_cache(self):
         """Clear all caches."""
         with self.lock:
             self._search_cache.clear()
+            self._simple_etags.clear()
             self.last_check_time.clear()
             self.request_failures.clear()
             logger.info("All caches cleared")
@@ -595,16 +791,16 @@ class PackageManagerCore:
     def _get_cached_packages(self, environment_id: str) -> Dict:
         """Get cached packages for environment."""
         with self.lock:
-            if environment_id not in self._packages_cache:
+            cache_entry = self._packages_cache.get(environment_id)
+            if cache_entry is None:
                 return {}
             
-            cache_entry = self._packages_cache[environment_id]
-            cache_time = cache_entry.get("timestamp", datetime.min)
-            
-            if datetime.now() - cache_time > self._cache_expiry:
+            if time.monotonic() - cache_entry.get("timestamp", 0.0) > self._cache_expiry:
                 del self._packages_cache[environment_id]
                 return {}
             
+            # Reads count as use, so the size limit evicts the least recently used environment
+            self._packages_cache.move_to_end(environment_id)
             return cache_entry.get("packages", {})
 
     def _save_packages_to_cache(self, environment_id: str, packages: List[Dict]):
@@ -613,22 +809,44 @@ class PackageManagerCore:
             return
         
         with self.lock:
+            # (ver, lat, stat) tuples keyed by lowercase name; the entry carries one timestamp
             packages_dict = {}
             for pkg in packages:
                 name = pkg.get("name", "")
                 if name:
-                    packages_dict[name] = {
-                        "ver": pkg.get("ver", "Unknown"),  # Save version for comparison
-                        "lat": pkg.get("lat", "Unknown"),
-                        "stat": pkg.get("stat", "Unknown"),
-                        "timestamp": datetime.now()
-                    }
+                    packages_dict[name.lower()] = (
+                        pkg.get("ver", "Unknown"),  # Save version for comparison
+                        pkg.get("lat", "Unknown"),
+                        pkg.get("stat", "Unknown"),
+                    )
             
+            # LRU insert: refresh an existing entry, otherwise evict the oldest one if full
+            if environment_id in self._packages_cache:
+                self._packages_cache.move_to_end(environment_id)
+            elif len(self._packages_cache) >= self._packages_cache_max_size:
+                self._packages_cache.popitem(last=False)
             self._packages_cache[environment_id] = {
                 "packages": packages_dict,
-                "timestamp": datetime.now()
+                "timestamp": time.monotonic()
             }
-            self._trim_cache(self._packages_cache, self._packages_cache_max_size)
+            if environment_id == self.current_environment_id:
+                self._cache_dirty.clear()
+
+    def _flush_cache_updates(self):
+        """Write packages changed since the last save into the current environment's cache."""
+        with self.lock:
+            environment_id = self.current_environment_id
+            if not environment_id or not self.packages:
+                return
+            cache_entry = self._packages_cache.get(environment_id)
+            if cache_entry is None:
+                # Nothing to patch (first save or expired): store the full list
+                self._save_packages_to_cache(environment_id, self.packages)
+                return
+            if self._cache_dirty:
+                cache_entry["packages"].update(self._cache_dirty)
+                self._cache_dirty.clear()
+            cache_entry["timestamp"] = time.monotonic()
     
     def load_packages_with_cache(self, ui_callback, environment_id: str = None, force_refresh: bool = False):
         """Load packages with cache support."""
@@ -661,24 +879,20 @@ class PackageManagerCore:
                 
                 # Determine if we are targeting the HOST environment
                 # If target python is same as running python, we can use introspection
-                target_python = self.get_python_command()
-                if isinstance(target_python, list): target_python = target_python[0] # Handle list case just in case
-                
-                is_host_env = False
-                try:
-                    if os.path.realpath(target_python) == os.path.realpath(sys.executable):
-                        is_host_env = True
-                except: pass
+                is_host_env = self._targets_running_interpreter()
                 
-                # Use parallel strategies
-                packages_from_pip = self._try_pip_list()
+                # In-process introspection for the host environment; pip is only the fallback
+                packages_from_pip = []
                 packages_from_importlib = []
                 
-                # Introspection only for host environment
                 if is_host_env:
                     packages_from_importlib = self._try_importlib()
                 else:
-                    logger.info("Target is external environment: Skipping importlib/site-packages strategies")
+                    # External environment: ask its interpreter directly (no pip startup)
+                    packages_from_pip = self._try_interpreter_metadata()
+                
+                if not packages_from_importlib and not packages_from_pip:
+                    packages_from_pip = self._try_pip_list()
                 
                 # Check generation before merging
                 with self._load_gen_lock:
@@ -705,9 +919,7 @@ class PackageManagerCore:
                 for pkg in new_packages:
                     name = pkg["name"].lower()
                     if name in cached_packages:
-                        cached = cached_packages[name]
-                        pkg["lat"] = cached.get("lat", "Unknown")
-                        pkg["stat"] = cached.get("stat", "Unknown")
+                        _, pkg["lat"], pkg["stat"] = cached_packages[name]
                 
                 new_packages.sort(key=lambda x: x["name"].lower())
                 
@@ -722,7 +934,7 @@ class PackageManagerCore:
                     # This avoids race conditions with asynchronous update checks
                     if environment_id == self.current_environment_id:
                         # 1. Get current in-memory status
-                        current_states = {p["name"].lower(): {"ver": p.get("ver"), "lat": p.get("lat"), "stat": p.get("stat")} for p in self.packages}
+                        current_states = {p["name"].lower(): (p.get("ver"), p.get("lat"), p.get("stat")) for p in self.packages}
                         
                         # 2. Get status from disk cache (if memory is empty/Unknown)
                         disk_cache = self._get_cached_packages(environment_id)
@@ -738,20 +950,18 @@ class PackageManagerCore:
                             best_lat = "Unknown"
                             best_stat = "Unknown"
                             
-                            if curr and curr.get("ver") == pkg["ver"]:
-                                if curr["lat"] not in (None, "Unknown"):
-                                    best_lat = curr["lat"]
-                                    best_stat = curr["stat"]
+                            if curr and curr[0] == pkg["ver"]:
+                                if curr[1] not in (None, "Unknown"):
+                                    best_lat, best_stat = curr[1], curr[2]
                             
                             # Check Disk Cache second (if memory didn't yield result)
-                            elif cached and cached.get("ver") == pkg["ver"]:
-                                if cached.get("lat") not in (None, "Unknown"):
-                                    best_lat = cached["lat"]
-                                    best_stat = cached.get("stat", "Unknown")
+                            elif cached and cached[0] == pkg["ver"]:
+                                if cached[1] not in (None, "Unknown"):
+                                    best_lat, best_stat = cached[1], cached[2]
                             
                             # Smart Inference: If version matches known latest -> Updated
-                            elif cached and cached.get("lat") == pkg["ver"]:
-                                best_lat = cached["lat"]
+                            elif cached and cached[1] == pkg["ver"]:
+                                best_lat = cached[1]
                                 best_stat = "Updated"
                             
                             # Apply best found state if currently unknown
@@ -762,21 +972,49 @@ class PackageManagerCore:
 
                     if not self._shutting_down.is_set():
                         self.packages = new_packages
+                        self._mark_packages_changed(structural=True)
+                        self._cache_dirty.clear()
                         # Only save to cache if we actually have some data to preserve
                         if environment_id:
                             self._save_packages_to_cache(environment_id, new_packages)
                 
-                logger.info(f"Loaded {len(new_packages)} packages successfully")
+                logger.info("Loaded %s packages successfully", len(new_packages))
                 
                 if not self._shutting_down.is_set() and ui_callback:
                     ui_callback()
                 
             except Exception as e:
-                logger.error(f"Load error: {e}")
+                logger.error("Load error: %s", e)
                 if not self._shutting_down.is_set() and ui_callback:
                     ui_callback()
         
-        threading.Thread(target=load_task, daemon=True).start()
+        self._submit_task(load_task)
+
+    def _try_interpreter_metadata(self):
+        """List packages by running importlib.metadata in the target interpreter (skips pip's CLI startup)"""
+        packages = []
+        try:
+            # Bytes straight into the JSON decoder: no str copy of the output
+            result = run_hidden(
+                self.get_python_command() + ["-c", _LIST_DISTRIBUTIONS_SCRIPT],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=15,
+                shell=False
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                for name, version in json_loads(result.stdout):
+                    if name and self._is_valid_package_name(name):
+                        packages.append({
+                            "name": name,
+                            "ver": version or "Unknown",
+                            "lat": "Unknown",
+                            "stat": "Unknown"
+                        })
+                logger.info("Got %s packages via target interpreter metadata", len(packages))
+        except Exception as e:
+            logger.debug("Interpreter metadata listing failed: %s", e)
+        return packages
 
     def _try_pip_list(self):
         """Try to get packages via pip list - multiple formats"""
@@ -793,10 +1031,11 @@ class PackageManagerCore:
         for fmt in formats:
             try:
                 cmd = pip_cmd + fmt
-                result = subprocess.run(
+                # stdout stays bytes (the JSON decoder takes them as-is); stderr is never read
+                result = run_hidden(
                     cmd,
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
                     timeout=15,
                     shell=False
                 )
@@ -804,7 +1043,7 @@ class PackageManagerCore:
                 if result.returncode == 0 and result.stdout.strip():
                     if fmt[0] == "freeze":
                         # Parse freeze format
-                        for line in result.stdout.strip().split('\n'):
+                        for line in result.stdout.decode('utf-8', errors='replace').strip().split('\n'):
                             if '==' in line:
                                 name, version = line.split('==', 1)
                                 packages.append({
@@ -815,7 +1054,7 @@ class PackageManagerCore:
                                 })
                     else:
                         # Parse JSON format
-                        data = json.loads(result.stdout)
+                        data = json_loads(result.stdout)
                         for pkg in data:
                             packages.append({
                                 "name": pkg.get("name", ""),
@@ -824,11 +1063,11 @@ class PackageManagerCore:
                                 "stat": "Unknown"
                             })
                     
-                    logger.info(f"Got {len(packages)} packages via pip {' '.join(fmt)}")
+                    logger.info("Got %s packages via pip %s", len(packages), ' '.join(fmt))
                     break  # Stop at first success
                     
             except Exception as e:
-                logger.debug(f"pip {' '.join(fmt)} failed: {e}")
+                logger.debug("pip %s failed: %s", ' '.join(fmt), e)
                 continue
         
         return packages
@@ -843,17 +1082,17 @@ class PackageManagerCore:
                 from importlib.metadata import distributions
                 for dist in distributions():
                     try:
-                        name = dist.metadata.get("Name") or dist.name
+                        name, version = _dist_name_version(dist)
                         if name and self._is_valid_package_name(name):
                             packages.append({
                                 "name": name,
-                                "ver": dist.version,
+                                "ver": version,
                                 "lat": "Unknown",
                                 "stat": "Unknown"
                             })
                     except:
                         continue
-                logger.info(f"Got {len(packages)} packages via importlib.metadata")
+                logger.info("Got %s packages via importlib.metadata", len(packages))
                 return packages
             except ImportError:
                 pass
@@ -863,17 +1102,17 @@ class PackageManagerCore:
                 from importlib_metadata import distributions
                 for dist in distributions():
                     try:
-                        name = dist.metadata.get("Name") or dist.name
+                        name, version = _dist_name_version(dist)
                         if name and self._is_valid_package_name(name):
                             packages.append({
                                 "name": name,
-                                "ver": dist.version,
+                                "ver": version,
                                 "lat": "Unknown",
                                 "stat": "Unknown"
                             })
                     except:
                         continue
-                logger.info(f"Got {len(packages)} packages via importlib_metadata")
+                logger.info("Got %s packages via importlib_metadata", len(packages))
                 return packages
             except ImportError:
                 pass
@@ -888,7 +1127,7 @@ class PackageManagerCore:
                         "lat": "Unknown",
                         "stat": "Unknown"
                     })
-                logger.info(f"Got {len(packages)} packages via pkg_resources")
+                logger.info("Got %s packages via pkg_resources", len(packages))
                 return packages
             except ImportError:
                 pass
@@ -897,7 +1136,7 @@ class PackageManagerCore:
             packages = self._scan_site_packages()
             
         except Exception as e:
-            logger.error(f"All importlib methods failed: {e}")
+            logger.error("All importlib methods failed: %s", e)
         
         return packages
 
@@ -944,9 +1183,9 @@ class PackageManagerCore:
                     except:
                         continue
             
-            logger.info(f"Got {len(packages)} packages from site-packages")
+            logger.info("Got %s packages from site-packages", len(packages))
         except Exception as e:
-            logger.error(f"Site-packages scan failed: {e}")
+            logger.error("Site-packages scan failed: %s", e)
         
         return packages
 
@@ -956,35 +1195,35 @@ class PackageManagerCore:
         
         # 1. Check Python path
         python_cmd = self.get_pip_command()[0]
-        logger.info(f"Python executable: {python_cmd}")
+        logger.info("Python executable: %s", python_cmd)
         
         # 2. Check pip availability
         try:
-            result = subprocess.run(
+            result = run_hidden(
                 [python_cmd, "-m", "pip", "--version"],
                 capture_output=True,
                 text=True,
                 timeout=5
             )
-            logger.info(f"Pip version: {result.stdout.strip() if result.returncode == 0 else 'NOT AVAILABLE'}")
+            logger.info("Pip version: %s", result.stdout.strip() if result.returncode == 0 else 'NOT AVAILABLE')
         except Exception as e:
-            logger.error(f"Pip check failed: {e}")
+            logger.error("Pip check failed: %s", e)
         
         # 3. Check actual installed packages
         try:
             # Direct import check
             import pkgutil
-            modules = list(pkgutil.iter_modules())
-            logger.info(f"Found {len(modules)} modules via pkgutil")
+            module_count = sum(1 for _ in pkgutil.iter_modules())
+            logger.info("Found %s modules via pkgutil", module_count)
         except Exception as e:
-            logger.error(f"Module check failed: {e}")
+            logger.error("Module check failed: %s", e)
     
     def set_pip_command(self, pip_cmd: List[str]):
         """Set pip command for current environment."""
         with self.lock:
             if pip_cmd and isinstance(pip_cmd, list):
                 self.pip_command = pip_cmd.copy()
-                logger.info(f"Set pip command: {' '.join(pip_cmd)}")
+                logger.info("Set pip command: %s", ' '.join(pip_cmd))
             else:
                 # Use detector to get actual Python (handles frozen mode)
                 self.pip_command = [detector.get_actual_python_executable(), "-m", "pip"]
@@ -1020,16 +1259,7 @@ class PackageManagerCore:
         
         def search_task():
             try:
-                results = []
-                
-                # Try JSON API first
-                json_results = self._search_json_api(search_term)
-                if json_results:
-                    results = json_results
-                else:
-                    web_results = self._search_web_scrape(search_term)
-                    if web_results:
-                        results = web_results
+                results = self.search_pypi_raw(search_term)
                 
                 processed = self._process_search_results(results) if not self._shutting_down.is_set() else []
                 
@@ -1037,11 +1267,32 @@ class PackageManagerCore:
                     ui_callback(processed)
                     
             except Exception as e:
-                logger.error(f"Search failed: {e}")
+                logger.error("Search failed: %s", e)
                 if not self._shutting_down.is_set() and ui_callback:
                     ui_callback([])
         
-        threading.Thread(target=search_task, daemon=True).start()
+        self._submit_task(search_task)
+    
+    def search_pypi_raw(self, search_term: str) -> list:
+        """Query PyPI (JSON API, then web fallback) with a short-lived LRU cache."""
+        key = search_term.strip().lower()
+        now = time.monotonic()
+        with self.lock:
+            cached = self._search_cache.get(key)
+            if cached and now - cached["timestamp"] < self._search_cache_ttl:
+                self._search_cache.move_to_end(key)
+                return cached["results"]
+        
+        results = self._search_json_api(search_term) or self._search_web_scrape(search_term)
+        
+        if results and not self._shutting_down.is_set():
+            with self.lock:
+                if key in self._search_cache:
+                    self._search_cache.move_to_end(key)
+                elif len(self._search_cache) >= self._search_cache_max_size:
+                    self._search_cache.popitem(last=False)
+                self._search_cache[key] = {"results": results, "timestamp": now}
+        return results
     
     def _search_json_api(self, search_term: str) -> list:
         """Search using PyPI JSON API."""
@@ -1049,25 +1300,20 @@ class PackageManagerCore:
             return []
         
         try:
-            url = f"https://pypi.org/pypi/{urllib.parse.quote(search_term.strip().lower())}/json"
+            path = f"/pypi/{urllib.parse.quote(search_term.strip().lower())}/json"
             
             try:
-                # Try with standard verification first
-                try:
-                    response = urllib.request.urlopen(url, timeout=10)
-                except ssl.SSLError:
-                     # Fail securely, do not bypass SSL
-                    raise
-                except Exception:
-                    raise
-
-                
-                raw = response.read(self.MAX_JSON_SIZE + 1)
+                # Certificate errors propagate (no verification bypass)
+                status, _, raw = self._pypi_get(path, limit=self.MAX_JSON_SIZE + 1)
+                if status == 404:
+                    return self._search_json_search_api(search_term)
+                if status != 200:
+                    return []
                 
                 if len(raw) > self.MAX_JSON_SIZE:
                     return []
                 
-                data = json.loads(raw)
+                data = json_loads(raw)
                 info = data.get("info", {})
                 
                 name = info.get("name", "").strip()
@@ -1083,10 +1329,6 @@ class PackageManagerCore:
                     "summary": summary
                 }]
                 
-            except urllib.error.HTTPError as e:
-                if e.code == 404:
-                    return self._search_json_search_api(search_term)
-                return []
             except Exception:
                 return []
             
@@ -1097,21 +1339,20 @@ class PackageManagerCore:
         """Search using PyPI search endpoint."""
         try:
             encoded = urllib.parse.quote(search_term)
-            url = f"https://pypi.org/search/?q={encoded}&format=json"
+            path = f"/search/?q={encoded}&format=json"
             
             try:
                 try:
-                    response = urllib.request.urlopen(url, timeout=10)
+                    status, _, raw = self._pypi_get(path, limit=self.MAX_JSON_SIZE + 1)
                 except Exception:
                     return []
-
-                
-                raw = response.read(self.MAX_JSON_SIZE + 1)
+                if status != 200:
+                    return []
                 
                 if len(raw) > self.MAX_JSON_SIZE:
                     return []
                 
-                data = json.loads(raw)
+                data = json_loads(raw)
                 results = []
                 
                 for item in data.get('projects', [])[:20]:
@@ -1131,39 +1372,43 @@ class PackageManagerCore:
         """Web scraping fallback for search."""
         try:
             encoded = urllib.parse.quote(search_term)
-            url = f"https://pypi.org/search/?q={encoded}"
+            path = f"/search/?q={encoded}"
             
             try:
                 try:
-                    response = urllib.request.urlopen(url, timeout=10)
+                    status, _, raw = self._pypi_get(path)
                 except Exception:
                     return []
-
+                if status != 200:
+                    return []
                 
-                html = response.read().decode('utf-8', errors='ignore')
+                html = raw.decode('utf-8', errors='ignore')
                 
-                pattern = re.compile(
-                    r'<span[^>]*class="[^"]*package-snippet__name[^"]*"[^>]*>([^<]{1,100})</span>'
-                    r'.*?<span[^>]*class="[^"]*package-snippet__version[^"]*"[^>]*>([^<]{1,50})</span>',
-                    re.DOTALL
-                )
+                # One linear pass over name/version spans; each name takes the version before the next name
+                pairs = []
+                for match in _SNIPPET_SPAN_RE.finditer(html):
+                    text = match.group(2).strip()
+                    if match.group(1) == "name":
+                        pairs.append([text, 'Unknown'])
+                    elif pairs and pairs[-1][1] == 'Unknown' and len(text) <= 50:
+                        pairs[-1][1] = text
                 
                 results = []
                 seen = set()
                 
-                for match in pattern.finditer(html):
-                    name = match.group(1).strip()
-                    version = match.group(2).strip() if match.group(2) else 'Unknown'
-                    
-                    if name and name.lower() not in seen:
-                        seen.add(name.lower())
+                for name, version in pairs:
+                    name_lower = name.lower()
+                    if name and name_lower not in seen:
+                        seen.add(name_lower)
                         results.append({
                             "name": name,
-                            "version": version,
+                            "version": version or 'Unknown',
                             "summary": "No description available"
                         })
+                        if len(results) == 50:
+                            break
                 
-                return results[:50]
+                return results
                 
             except Exception:
                 return []
@@ -1175,15 +1420,9 @@ class PackageManagerCore:
         if not raw_results:
             return []
         
+        # Look up only the result names instead of copying every installed package
         with self.lock:
-            local_packages = {}
-            for p in self.packages:
-                local_packages[p["name"].lower()] = {
-                    "name": p["name"],
-                    "version": p["ver"],
-                    "latest": p["lat"],
-                    "status": p["stat"]
-                }
+            local_packages = self._package_index(lowercase=True)
         
         processed = []
         seen = set()
@@ -1200,13 +1439,14 @@ class PackageManagerCore:
             
             local_info = local_packages.get(name_lower)
             is_installed = local_info is not None
-            installed_version = local_info["version"] if local_info else None
-            latest_version = local_info["latest"] if local_info else result.get("version", "Unknown")
+            installed_version = local_info["ver"] if is_installed else None
+            latest_version = local_info["lat"] if is_installed else result.get("version", "Unknown")
             
+            summary = result.get("summary") or ""
             processed.append({
                 "name": name,
                 "version": result.get("version", "Unknown"),
-                "summary": (result.get("summary", "")[:150] + "...") if len(result.get("summary", "")) > 150 else result.get("summary", ""),
+                "summary": (summary[:150] + "...") if len(summary) > 150 else summary,
                 "installed": is_installed,
                 "installed_version": installed_version,
                 "latest_version": latest_version
@@ -1223,11 +1463,12 @@ class PackageManagerCore:
                 ui_callback(False, "Shutting down")
             return
         
+        emit_progress, finish_progress = self._throttled_progress_emitter()
+
         def internal_progress_callback(data):
             if progress_callback:
                 progress_callback(data)
-            if self.signals:
-                self.signals.operation_progress.emit(data)
+            emit_progress(data)
 
         def install_task():
             if self.signals:
@@ -1242,11 +1483,14 @@ class PackageManagerCore:
                 
                 pip_cmd = self.get_pip_command()
                 
-                success, message, _ = run_pip_with_real_progress(
-                    install_cmd, 
-                    progress_callback=internal_progress_callback,
-                    pip_cmd=pip_cmd
-                )
+                try:
+                    success, message, _ = run_pip_with_real_progress(
+                        install_cmd, 
+                        progress_callback=internal_progress_callback,
+                        pip_cmd=pip_cmd
+                    )
+                finally:
+                    finish_progress()
                 
                 if not success:
                     raise Exception(message)
@@ -1264,15 +1508,93 @@ class PackageManagerCore:
                         self.signals.operation_completed.emit(True, f"Installed {package_name}")
                     
             except Exception as e:
-                logger.error(f"Install failed: {e}")
+                logger.error("Install failed: %s", e)
                 if not self._shutting_down.is_set():
                     if ui_callback:
                         ui_callback(False, str(e))
                     if self.signals:
                         self.signals.operation_completed.emit(False, str(e))
         
-        threading.Thread(target=install_task, daemon=True).start()
+        self._submit_task(install_task)
     
+    def _throttled_progress_emitter(self, interval: float = 0.033):
+        """Progress callback that forwards pip events to operation_progress at most ~30 times a second.
+
+        Output lines are joined into one 'output' event and only the latest
+        'progress' event is kept; any other event type flushes them and goes out at once.
+        Returns (callback, finish): call finish() once pip has returned and before
+        operation_completed, so the last events are delivered and nothing follows.
+        """
+        cond = threading.Condition()
+        pending_lines = []
+        pending = {"progress": None, "last_flush": 0.0, "due": None, "closed": False, "thread": None}
+
+        def flush():
+            if not self.signals:
+                pending_lines.clear()
+                pending["progress"] = None
+                return
+            if pending["progress"] is not None:
+                self.signals.operation_progress.emit(pending["progress"])
+                pending["progress"] = None
+            if pending_lines:
+                self.signals.operation_progress.emit({'type': 'output', 'line': "\n".join(pending_lines)})
+                pending_lines.clear()
+            pending["last_flush"] = time.monotonic()
+
+        def trailing_flusher():
+            # One thread per operation delivers what is left when pip goes quiet (e.g. during a long download)
+            with cond:
+                while not pending["closed"]:
+                    due = pending["due"]
+                    if due is None:
+                        cond.wait()
+                        continue
+                    remaining = due - time.monotonic()
+                    if remaining > 0:
+                        cond.wait(remaining)
+                        continue
+                    pending["due"] = None
+                    flush()
+
+        def callback(data):
+            # stdout and stderr are read on separate threads
+            with cond:
+                if pending["closed"]:
+                    return
+                msg_type = data.get('type')
+                if msg_type == 'output':
+                    pending_lines.append(data.get('line', ''))
+                elif msg_type == 'progress':
+                    pending["progress"] = data
+                else:
+                    pending["due"] = None
+                    flush()
+                    if self.signals:
+                        self.signals.operation_progress.emit(data)
+                    return
+                if time.monotonic() - pending["last_flush"] >= interval:
+                    pending["due"] = None
+                    flush()
+                elif pending["due"] is None:
+                    pending["due"] = time.monotonic() + interval
+                    if pending["thread"] is None:
+                        pending["thread"] = threading.Thread(target=trailing_flusher, daemon=True, name="pyscope-progress")
+                        pending["thread"].start()
+                    else:
+                        cond.notify()
+
+        def finish():
+            with cond:
+                if pending["closed"]:
+                    return
+                pending["closed"] = True
+                pending["due"] = None
+                flush()
+                cond.notify()
+
+        return callback, finish
+
     def uninstall_package(self, package_name: str, ui_callback=None):
         """Uninstall package from current environment."""
         if self._shutting_down.is_set():
@@ -1288,19 +1610,30 @@ class PackageManagerCore:
                 pip_cmd = self.get_pip_command()
                 cmd = ["uninstall", "-y", package_name]
                 
-                success, message, _ = run_pip_with_real_progress(
-                    cmd, 
-                    progress_callback=lambda d: self.signals.operation_progress.emit(d) if self.signals else None,
-                    pip_cmd=pip_cmd
-                )
+                emit_progress, finish_progress = self._throttled_progress_emitter()
+                try:
+                    success, message, _ = run_pip_with_real_progress(
+                        cmd, 
+                        progress_callback=emit_progress,
+                        pip_cmd=pip_cmd
+                    )
+                finally:
+                    finish_progress()
                 
                 if not success:
                     raise Exception(message)
                 
                 # Remove from local list
                 with self.lock:
-                    self.packages = [p for p in self.packages if p["name"].lower() != package_name.lower()]
+                    removed_name = package_name.lower()
+                    self.packages = [p for p in self.packages if p["name"].lower() != removed_name]
+                    self._mark_packages_changed(structural=True)
                     self._search_cache.clear()
+                    # Update the cache here on the worker; the dirty-entry flush only adds and patches
+                    self._cache_dirty.pop(removed_name, None)
+                    cache_entry = self._packages_cache.get(self.current_environment_id)
+                    if cache_entry is not None:
+                        cache_entry["packages"].pop(removed_name, None)
                 
                 if not self._shutting_down.is_set():
                     if ui_callback:
@@ -1309,14 +1642,14 @@ class PackageManagerCore:
                         self.signals.operation_completed.emit(True, f"Uninstalled {package_name}")
                     
             except Exception as e:
-                logger.error(f"Uninstall failed: {e}")
+                logger.error("Uninstall failed: %s", e)
                 if not self._shutting_down.is_set():
                     if ui_callback:
                         ui_callback(False, str(e))
                     if self.signals:
                         self.signals.operation_completed.emit(False, str(e))
         
-        threading.Thread(target=uninstall_task, daemon=True).start()
+        self._submit_task(uninstall_task)
 
     def is_operation_active(self):
         """Check if any background operation is currently active."""
@@ -1327,91 +1660,131 @@ class PackageManagerCore:
                 return True
         return False
 
+    def _targets_running_interpreter(self) -> bool:
+        """True when the selected environment is the interpreter running PyScope."""
+        target_python = self.get_python_command()
+        if isinstance(target_python, list): target_python = target_python[0] # Handle list case just in case
+        try:
+            return os.path.realpath(target_python) == os.path.realpath(sys.executable)
+        except Exception:
+            return False
+
+    def _get_installed_version(self, package_name: str, pip_cmd: List[str], timeout: int = 10):
+        """Installed version of a package in the target env, or None if it is not installed.
+
+        Reads the package metadata in-process when the target env is the running
+        interpreter and only spawns `pip show` otherwise (or when that misses).
+        Returns "" if pip finds the package but reports no version.
+        """
+        if self._targets_running_interpreter():
+            from importlib import invalidate_caches
+            from importlib.metadata import distribution, PackageNotFoundError
+            # Pick up distributions pip has just written to site-packages
+            invalidate_caches()
+            try:
+                return distribution(package_name).version
+            except PackageNotFoundError:
+                pass
+        
+        return self._pip_show_version_batched(package_name, pip_cmd, timeout)
+
+    def _pip_show_version_batched(self, package_name: str, pip_cmd: List[str], timeout: int):
+        """pip show lookup that shares one process between concurrent callers.
+
+        While one `pip show` runs, later requests for the same pip command queue up
+        and the next run queries all of them at once.
+        """
+        key = tuple(pip_cmd)
+        with self._version_batch_lock:
+            batch = self._version_batches.get(key)
+            if batch is None:
+                batch = self._version_batches[key] = {
+                    "names": set(), "results": {}, "error": None, "done": threading.Event()
+                }
+            batch["names"].add(package_name)
+        
+        with self._version_query_lock:
+            if not batch["done"].is_set():
+                # First in line: close the batch and run it for everyone queued on it
+                with self._version_batch_lock:
+                    if self._version_batches.get(key) is batch:
+                        del self._version_batches[key]
+                try:
+                    batch["results"] = self._pip_show_versions(sorted(batch["names"]), pip_cmd, timeout)
+                except Exception as e:
+                    batch["error"] = e
+                finally:
+                    batch["done"].set()
+        
+        if batch["error"] is not None:
+            raise batch["error"]
+        return batch["results"].get(self._normalize_name(package_name))
+
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        return _NAME_SEPARATORS.sub("-", name).lower()
+
+    def _pip_show_versions(self, package_names: List[str], pip_cmd: List[str], timeout: int) -> Dict:
+        """Map normalized name -> version ("" if unreported) for the installed packages among package_names."""
+        result = run_hidden(
+            pip_cmd + ["show"] + package_names,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            encoding='utf-8',
+            errors='replace'
+        )
+        # pip exits non-zero if any name is missing but still prints the ones it found,
+        # one block per package separated by "---"
+        versions = {}
+        name = None
+        version = ""
+        for line in result.stdout.splitlines() + ["---"]:
+            if line.startswith("---"):
+                if name:
+                    versions[self._normalize_name(name)] = version
+                name, version = None, ""
+            elif line.startswith("Name:"):
+                name = line.split(":", 1)[1].strip()
+            elif line.startswith("Version:"):
+                version = line.split(":", 1)[1].strip()
+        return versions
+
     def _update_after_install(self, package_name: str, pip_cmd: List[str]):
         """Update package info after installation."""
         try:
-            cmd = pip_cmd + ["show", package_name]
+            installed_version = self._get_installed_version(package_name, pip_cmd)
+            if not installed_version:
+                return
+            latest_version = self._fetch_latest_via_simple(package_name) or self._fetch_package_info(package_name)
             
             try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    shell=False
-                )
-                
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if line.startswith("Version:"):
-                            installed_version = line.split(":", 1)[1].strip()
-                            latest_version = self._fetch_package_info(package_name)
-                            
-                            try:
-                                from .utils import VersionComparator
-                                status = "Updated" if not VersionComparator().is_outdated(installed_version, latest_version) else "Outdated"
-                            except:
-                                # Fallback with normalization
-                                status = "Updated" if str(installed_version).strip().lower() == str(latest_version).strip().lower() else "Outdated"
-                            
-                            with self.lock:
-                                for i, p in enumerate(self.packages):
-                                    if p["name"].lower() == package_name.lower():
-                                        self.packages[i]["ver"] = installed_version
-                                        self.packages[i]["lat"] = latest_version
-                                        self.packages[i]["stat"] = status
-                                        break
-                                else:
-                                    self.packages.append({
-                                        "name": package_name,
-                                        "ver": installed_version,
-                                        "lat": latest_version,
-                                        "stat": status
-                                    })
-                                    self.packages.sort(key=lambda x: x["name"].lower())
-                            
-                            return
-                
-            except Exception:
-                pass
+                status = "Updated" if not self._version_comparator.is_outdated(installed_version, latest_version) else "Outdated"
+            except Exception as e:
+                logger.debug("Version comparison failed for %s: %s", package_name, e)
+                # Fallback with normalization
+                status = "Updated" if str(installed_version).strip().lower() == str(latest_version).strip().lower() else "Outdated"
             
-            # Fallback to importlib
-            try:
-                from importlib.metadata import distribution, PackageNotFoundError
-                dist = distribution(package_name)
-                installed_version = dist.version
-                latest_version = self._fetch_package_info(package_name)
-                
-                try:
-                    from .utils import VersionComparator
-                    status = "Updated" if not VersionComparator().is_outdated(installed_version, latest_version) else "Outdated"
-                except:
-                    # Fallback with normalization
-                    status = "Updated" if str(installed_version).strip().lower() == str(latest_version).strip().lower() else "Outdated"
-                
-                with self.lock:
-                    for i, p in enumerate(self.packages):
-                        if p["name"].lower() == package_name.lower():
-                            self.packages[i]["ver"] = installed_version
-                            self.packages[i]["lat"] = latest_version
-                            self.packages[i]["stat"] = status
-                            break
-                    else:
-                        self.packages.append({
-                            "name": package_name,
-                            "ver": installed_version,
-                            "lat": latest_version,
-                            "stat": status
-                        })
-                        self.packages.sort(key=lambda x: x["name"].lower())
-                
-            except PackageNotFoundError:
-                pass
-            except Exception:
-                pass
+            with self.lock:
+                pkg = self._package_index(lowercase=True).get(package_name.lower())
+                if pkg is not None:
+                    pkg["ver"] = installed_version
+                    pkg["lat"] = latest_version
+                    pkg["stat"] = status
+                    self._mark_packages_changed(pkg)
+                else:
+                    pkg = {
+                        "name": package_name,
+                        "ver": installed_version,
+                        "lat": latest_version,
+                        "stat": status
+                    }
+                    self.packages.append(pkg)
+                    self.packages.sort(key=lambda x: x["name"].lower())
+                    self._mark_packages_changed(pkg, structural=True)
                 
         except Exception as e:
-            logger.error(f"Error updating package info: {e}")
+            logger.error("Error updating package info: %s", e)
     
     def load_packages(self, ui_callback, force_refresh: bool = False):
         """Load packages (legacy method)."""
@@ -1428,17 +1801,14 @@ class PackageManagerCore:
     
     def filter_packages(self, mode="All"):
         """Filter packages by status."""
-        with self.lock:
-            packages_copy = list(self.packages)
-        
-        if mode == "All":
-            return packages_copy
-        elif mode == "Outdated":
-            return [p for p in packages_copy if p["stat"] == "Outdated"]
-        elif mode == "Updated":
-            return [p for p in packages_copy if p["stat"] == "Updated"]
-        else:
+        if mode not in ("All", "Outdated", "Updated"):
             return []
+        
+        # Filter straight from the shared list instead of copying it first
+        with self.lock:
+            if mode == "All":
+                return list(self.packages)
+            return [p for p in self.packages if p["stat"] == mode]
     
     def search_packages(self, term, ui_callback=None):
         """Search local packages by name (Threaded with Cancellation)."""
@@ -1452,33 +1822,38 @@ class PackageManagerCore:
                 term_lower = term.lower()
                 with self.lock:
                     if current_cancel.is_set(): return
-                    results = [p for p in self.packages if term_lower in p["name"].lower()]
+                    # Lowercased names come from the shared index, which status updates do not invalidate
+                    results = [p for name, p in self._package_index(lowercase=True).items() if term_lower in name]
                 
                 if not current_cancel.is_set() and ui_callback:
                     ui_callback(results)
             except Exception as e:
-                logger.error(f"Search failed: {e}")
+                logger.error("Search failed: %s", e)
         
-        threading.Thread(target=search_task, daemon=True).start()
+        self._submit_task(search_task)
     
     def get_package_by_name(self, package_name: str):
         """Get package by name."""
         with self.lock:
-            for p in self.packages:
-                if p["name"] == package_name:
-                    return p.copy()
-        return None
+            p = self._package_index().get(package_name)
+            return p.copy() if p is not None else None
+    
+    def get_packages_by_names(self, package_names):
+        """Get copies of the packages whose names are in package_names."""
+        with self.lock:
+            index = self._package_index()
+            return [index[name].copy() for name in package_names if name in index]
     
     def update_package_status(self, pkg_name: str, new_version: str, 
                             latest_version: str, status: str = "Updated"):
         """Update package status."""
         with self.lock:
-            for i, p in enumerate(self.packages):
-                if p["name"] == pkg_name:
-                    self.packages[i]["ver"] = new_version
-                    self.packages[i]["lat"] = latest_version
-                    self.packages[i]["stat"] = status
-                    break
+            p = self._package_index().get(pkg_name)
+            if p is not None:
+                p["ver"] = new_version
+                p["lat"] = latest_version
+                p["stat"] = status
+                self._mark_packages_changed(p)
     
     def clear_rate_limit(self, pkg_name: str):
         """Clear rate limiting for package."""
@@ -12,7 +12,9 @@ import platform
 import hashlib
 from datetime import datetime, timedelta
 from collections import OrderedDict
-from .utils import logger, safe_string_truncate
+from .utils import logger, safe_string_truncate, run_hidden
+
+_IS_WINDOWS = platform.system() == "Windows"
 
 
 def discover_python_installations() -> List[Dict]:
@@ -32,7 +34,7 @@ def discover_python_installations() -> List[Dict]:
                 pythons.append(info)
                 seen_paths.add(os.path.realpath(system_python))
         except Exception as e:
-            logger.warning(f"Failed to get system Python info: {e}")
+            logger.warning("Failed to get system Python info: %s", e)
     
     # Platform-specific discovery
     if platform.system() == "Windows":
@@ -52,23 +54,12 @@ def _discover_windows_pythons(seen_paths: set) -> List[Dict]:
     
     # Use py launcher if available
     try:
-        # Hide console window
-        startupinfo = None
-        creationflags = 0
-        if platform.system() == 'Windows':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            creationflags = subprocess.CREATE_NO_WINDOW
-        
-        result = subprocess.run(
+        result = run_hidden(
             ["py", "--list-paths"],
             capture_output=True,
             text=True,
             timeout=5,
-            shell=False,
-            startupinfo=startupinfo,
-            creationflags=creationflags
+            shell=False
         )
         
         if result.returncode == 0:
@@ -85,7 +76,7 @@ def _discover_windows_pythons(seen_paths: set) -> List[Dict]:
                                     pythons.append(info)
                                     seen_paths.add(real_path)
     except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-        logger.debug(f"py launcher not available: {e}")
+        logger.debug("py launcher not available: %s", e)
     
     # Common installation paths
     search_paths = []
@@ -109,7 +100,7 @@ def _discover_windows_pythons(seen_paths: set) -> List[Dict]:
                             pythons.append(info)
                             seen_paths.add(real_path)
         except Exception as e:
-            logger.debug(f"Failed to search {pattern}: {e}")
+            logger.debug("Failed to search %s: %s", pattern, e)
     
     return pythons
 
@@ -121,7 +112,7 @@ def _discover_unix_pythons(seen_paths: set) -> List[Dict]:
     # Use which command
     for binary in ["python", "python3"]:
         try:
-            result = subprocess.run(
+            result = run_hidden(
                 ["which", "-a", binary],
                 capture_output=True,
                 text=True,
@@ -139,7 +130,7 @@ def _discover_unix_pythons(seen_paths: set) -> List[Dict]:
                                 pythons.append(info)
                                 seen_paths.add(real_path)
         except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-            logger.debug(f"which failed for {binary}: {e}")
+            logger.debug("which failed for %s: %s", binary, e)
     
     # Common paths
     common_paths = [
@@ -166,7 +157,7 @@ def _discover_unix_pythons(seen_paths: set) -> List[Dict]:
                             pythons.append(info)
                             seen_paths.add(real_path)
         except Exception as e:
-            logger.debug(f"Failed to search {pattern}: {e}")
+            logger.debug("Failed to search %s: %s", pattern, e)
     
     return pythons
 
@@ -174,7 +165,7 @@ def _discover_unix_pythons(seen_paths: set) -> List[Dict]:
 def get_python_info(python_path: str) -> Optional[Dict]:
     """Get information about a Python installation."""
     try:
-        result = subprocess.run(
+        result = run_hidden(
             [python_path, "-c", "import sys; print(f'{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}')"],
             capture_output=True,
             text=True,
@@ -190,7 +181,7 @@ def get_python_info(python_path: str) -> Optional[Dict]:
                 "type": "system"
             }
     except Exception as e:
-        logger.debug(f"Failed to get info for {python_path}: {e}")
+        logger.debug("Failed to get info for %s: %s", python_path, e)
     
     return None
 
@@ -214,10 +205,33 @@ def safe_string_truncate(s: str, max_len: int = 100) -> str:
 class EnvironmentManager:
     """Manages Python environments for the application."""
     
+    # Discovery tables, built once rather than on every directory visited
+    _VENV_NAMES = ("venv", ".venv", "env", ".env")
+    _VENV_PYTHON = Path("Scripts", "python.exe") if _IS_WINDOWS else Path("bin", "python")
+    _PROTECTED_FOLDERS = frozenset({
+        "Application Data", "Local Settings", "Temporary Internet Files",
+        "Cookies", "History", "NetHood", "PrintHood", "Recent",
+        "SendTo", "Start Menu", "Templates", "My Documents",
+        "My Music", "My Pictures", "My Videos", "Desktop",
+        "Favorites", "Links", "Saved Games", "Searches",
+        "System Volume Information", "$RECYCLE.BIN", "Windows",
+        "Program Files", "Program Files (x86)", "ProgramData"
+    })
+    _IGNORE_DIRS = frozenset({
+        ".git", "__pycache__", "node_modules", ".venv", "venv", "env", ".env", 
+        "Lib", "Include", "Scripts", "build", "dist", ".idea", ".vscode",
+        "Application Data", "Local Settings", "Temporary Internet Files",
+        "Cookies", "History", "NetHood", "PrintHood", "Recent", 
+        "SendTo", "Start Menu", "Templates", "My Documents", "My Music",
+        "My Pictures", "My Videos"
+    })
+    
     def __init__(self):
         self.lock = threading.RLock()
         self.all_environments = []
         self.current_env = None
+        # Resolved pip command for current_env; reset whenever the environment changes
+        self._pip_command = None
         self._init_default_environment()
         self.refresh()
     
@@ -230,7 +244,7 @@ class EnvironmentManager:
         python_path = detector.get_actual_python_executable()
         
         try:
-            result = subprocess.run(
+            result = run_hidden(
                 [python_path, "-c", "import sys; print(f'{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}')"],
                 capture_output=True,
                 text=True,
@@ -248,7 +262,7 @@ class EnvironmentManager:
             "version": version
         }
         self.all_environments = [self.current_env]
-        logger.info(f"Default environment set: {python_path}")
+        logger.info("Default environment set: %s", python_path)
     
     def refresh(self):
         """Refresh the list of available environments."""
@@ -278,10 +292,10 @@ class EnvironmentManager:
                 if self.current_env and self.current_env not in self.all_environments:
                     self.all_environments.insert(0, self.current_env)
                 
-                logger.info(f"Refreshed environments: {len(self.all_environments)} found")
+                logger.info("Refreshed environments: %s found", len(self.all_environments))
                 
             except Exception as e:
-                logger.error(f"Failed to refresh environments: {e}")
+                logger.error("Failed to refresh environments: %s", e)
     
     def _discover_virtual_environments(self) -> List[Dict]:
         """Discover virtual environments with deep recursive search."""
@@ -310,7 +324,7 @@ class EnvironmentManager:
         
         # Recursive search in each location
         for location in search_locations:
-            if location.exists() and location.is_dir():
+            if location.is_dir():
                 self._search_for_venvs(location, venvs, seen_paths, max_depth=3)
         
         # 2. Conda environment discovery
@@ -326,30 +340,22 @@ class EnvironmentManager:
         except ImportError:
             logger.debug("PyenvDetector not available")
         except Exception as e:
-             logger.error(f"Pyenv discovery failed: {e}")
+             logger.error("Pyenv discovery failed: %s", e)
         
         return venvs
 
     def is_protected_windows_folder(self, folder_name: str) -> bool:
         """Check if folder is a protected Windows system folder"""
-        protected_folders = {
-            "Application Data", "Local Settings", "Temporary Internet Files",
-            "Cookies", "History", "NetHood", "PrintHood", "Recent",
-            "SendTo", "Start Menu", "Templates", "My Documents",
-            "My Music", "My Pictures", "My Videos", "Desktop",
-            "Favorites", "Links", "Saved Games", "Searches",
-            "System Volume Information", "$RECYCLE.BIN", "Windows",
-            "Program Files", "Program Files (x86)", "ProgramData"
-        }
-        return folder_name in protected_folders
+        return folder_name in self._PROTECTED_FOLDERS
 
     def _search_for_venvs(self, base_path: Path, venvs: List[Dict], seen_paths: set, max_depth: int, current_depth: int = 0):
         """Recursively search for virtual environments."""
-        if current_depth > max_depth or not base_path.exists() or not base_path.is_dir():
+        # Subdirectories were already checked with is_dir() by the caller
+        if current_depth > max_depth or (current_depth == 0 and not base_path.is_dir()):
             return
         
         # Guard against protected Windows folders early
-        if platform.system() == "Windows" and self.is_protected_windows_folder(base_path.name):
+        if _IS_WINDOWS and self.is_protected_windows_folder(base_path.name):
             return
         
         try:
@@ -360,18 +366,12 @@ class EnvironmentManager:
                 # Don't recurse into a venv itself usually, but we mark python path as seen
                 seen_paths.add(Path(venv_info["python_path"]).resolve())
             
-            # Ignore specific directories to optimize search
-            ignore_dirs = {
-                ".git", "__pycache__", "node_modules", ".venv", "venv", "env", ".env", 
-                "Lib", "Include", "Scripts", "build", "dist", ".idea", ".vscode",
-                "Application Data", "Local Settings", "Temporary Internet Files",
-                "Cookies", "History", "NetHood", "PrintHood", "Recent", 
-                "SendTo", "Start Menu", "Templates", "My Documents", "My Music",
-                "My Pictures", "My Videos"
-            }
-            
             # Recurse into subdirectories
             for item in base_path.iterdir():
+                # Name checks are free; do them before any stat call
+                if item.name in self._IGNORE_DIRS or item.name.startswith('.'):
+                    continue
+                
                 # SECURITY: Validate symlinks to prevent path traversal loops and escaping to system dirs
                 if item.is_symlink():
                     try:
@@ -380,37 +380,30 @@ class EnvironmentManager:
                         if not str(target).startswith(str(base_path.resolve())):
                             continue
                     except (PermissionError, OSError) as e:
-                        logger.debug(f"Failed to resolve symlink {item}: {e}")
+                        logger.debug("Failed to resolve symlink %s: %s", item, e)
                         continue
                     
-                if item.is_dir() and item.name not in ignore_dirs and not item.name.startswith('.'):
+                if item.is_dir():
                     # Skip very long paths
                     if len(str(item)) > 300:
                         continue
                     self._search_for_venvs(item, venvs, seen_paths, max_depth, current_depth + 1)
                     
         except (PermissionError, OSError) as e:
-            logger.debug(f"Permission denied accessing {base_path}: {e}")
+            logger.debug("Permission denied accessing %s: %s", base_path, e)
         except Exception as e:
-            logger.debug(f"Error scanning {base_path}: {e}")
+            logger.debug("Error scanning %s: %s", base_path, e)
 
     def _check_venv_in_path(self, path: Path, seen_paths: set) -> Optional[Dict]:
         """Check if path contains a virtual environment."""
-        # Check explicit venv folders inside this path OR if the path itself is a venv
-        candidates = [path]  # Check if 'path' IS the venv
-        
-        # Also check standard subfolder names if we are not already inside one
-        venv_names = ["venv", ".venv", "env", ".env"]
-        for name in venv_names:
-            candidates.append(path / name)
+        # Check if 'path' IS the venv, then the standard venv subfolder names
+        candidates = [path]
+        candidates.extend(path / name for name in self._VENV_NAMES)
             
         for venv_path in candidates:
-            if venv_path.exists() and venv_path.is_dir():
+            if venv_path.is_dir():
                 # Check for python executable
-                if platform.system() == "Windows":
-                    python_exe = venv_path / "Scripts" / "python.exe"
-                else:
-                    python_exe = venv_path / "bin" / "python"
+                python_exe = venv_path / self._VENV_PYTHON
                 
                 if python_exe.exists():
                     try:
@@ -499,7 +492,7 @@ class EnvironmentManager:
         
         # Scan environments
         for envs_dir in conda_locations:
-            if not envs_dir.exists() or not envs_dir.is_dir():
+            if not envs_dir.is_dir():
                 continue
             
             try:
@@ -532,7 +525,7 @@ class EnvironmentManager:
                         except Exception:
                             pass
             except Exception as e:
-                logger.debug(f"Error scanning conda envs at {envs_dir}: {e}")
+                logger.debug("Error scanning conda envs at %s: %s", envs_dir, e)
         
         return conda_envs
     
@@ -545,10 +538,18 @@ class EnvironmentManager:
         """Set the current environment."""
         with self.lock:
             self.current_env = env
-            logger.info(f"Environment changed to: {env.get('display', 'Unknown')}")
+            self._pip_command = None
+            logger.info("Environment changed to: %s", env.get('display', 'Unknown'))
     
     def get_pip_command(self) -> List[str]:
         """Get the pip command for the current environment."""
+        with self.lock:
+            if self._pip_command is None:
+                self._pip_command = self._resolve_pip_command()
+            return list(self._pip_command)
+    
+    def _resolve_pip_command(self) -> List[str]:
+        """Work out the pip command for the current environment (probes the filesystem)."""
         # Import here to avoid circular imports
         from .system import get_detector
         
@@ -601,12 +602,12 @@ class PyenvDetector:
         ]
         
         for pyenv_root in pyenv_roots:
-            if not pyenv_root.exists() or not pyenv_root.is_dir():
+            if not pyenv_root.is_dir():
                 continue
                 
             pyenv_envs.extend(self._scan_pyenv_root(pyenv_root, seen_paths))
         
-        logger.info(f"Detected {len(pyenv_envs)} pyenv environments")
+        logger.info("Detected %s pyenv environments", len(pyenv_envs))
         return pyenv_envs
     
     def _scan_pyenv_root(self, root: Path, seen_paths: set) -> List[Dict]:
@@ -644,9 +645,9 @@ class PyenvDetector:
                 seen_paths.add(real_path)
                 
         except PermissionError as e:
-            logger.warning(f"Permission denied accessing {root}: {e}")
+            logger.warning("Permission denied accessing %s: %s", root, e)
         except Exception as e:
-            logger.error(f"Error scanning {root}: {e}")
+            logger.error("Error scanning %s: %s", root, e)
         
         return environments
     
@@ -675,7 +676,7 @@ class PyenvDetector:
     def get_python_info(self, python_path: str) -> Optional[Dict]:
         """Get information about a Python installation."""
         try:
-            result = subprocess.run(
+            result = run_hidden(
                 [python_path, "-c", "import sys; print(f'{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}')"],
                 capture_output=True,
                 text=True,
@@ -689,6 +690,6 @@ class PyenvDetector:
                     "version": version
                 }
         except Exception as e:
-            logger.debug(f"Failed to get info for {python_path}: {e}")
+            logger.debug("Failed to get info for %s: %s", python_path, e)
         
         return None
\ No newline at end of file
@@ -8,7 +8,6 @@ import time
 import socket
 import platform
 import logging
-import subprocess
 from datetime import datetime
 from typing import Dict, Any
 
@@ -17,8 +16,9 @@ def validate_python_executable(path: str) -> bool:
     """Validate that a given path is a working Python interpreter."""
     if not path or not os.path.exists(path):
         return False
+    from .utils import run_hidden
     try:
-        result = subprocess.run(
+        result = run_hidden(
             [path, "-c", "import sys; print(sys.version_info[:2])"],
             capture_output=True, text=True, timeout=5
         )
@@ -37,6 +37,8 @@ class SystemDetector:
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_dir = self._setup_logging()
         self._cached_python_path = None
+        self._python_validated = False
+        self._health = None
         
     def _get_base_path(self) -> str:
         """Resolve base path for both source and PyInstaller environments."""
@@ -94,14 +96,10 @@ class SystemDetector:
         # 3. Windows 'py' launcher
         if sys.platform == 'win32':
             try:
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-                
-                result = subprocess.run(
+                from .utils import run_hidden
+                result = run_hidden(
                     ['py', '-0p'],
-                    capture_output=True, text=True, timeout=5, shell=False,
-                    startupinfo=startupinfo, creationflags=subprocess.CREATE_NO_WINDOW
+                    capture_output=True, text=True, timeout=5, shell=False
                 )
                 if result.returncode == 0:
                     for line in result.stdout.strip().split('\n'):
@@ -144,8 +142,9 @@ class SystemDetector:
             seen.add(path)
             
             if validate_python_executable(path):
-                self.logger.info(f"Found valid Python: {path}")
+                self.logger.info("Found valid Python: %s", path)
                 self._cached_python_path = path
+                self._python_validated = True
                 return path
         
         # Fallback
@@ -153,8 +152,11 @@ class SystemDetector:
         self._cached_python_path = sys.executable
         return self._cached_python_path
 
-    def check_health(self) -> Dict[str, Any]:
-        """Perform comprehensive system health check."""
+    def check_health(self, force: bool = False) -> Dict[str, Any]:
+        """Perform comprehensive system health check (cached after first run)."""
+        if self._health is not None and not force:
+            return self._health
+        
         results = { "status": "HEALTHY", "timestamp": time.time(), "details": {} }
         
         # Check Critical Resources
@@ -175,21 +177,29 @@ class SystemDetector:
         results["details"]["is_frozen"] = self.is_frozen
         
         # Validate Python & Pip
+        from .utils import run_hidden
         python_path = self.get_actual_python_executable()
         results["details"]["python_path"] = python_path
         
+        # The running interpreter, or one already validated during discovery,
+        # doesn't need a second probe
+        already_valid = self._python_validated or (not self.is_frozen and python_path == sys.executable)
+        
         try:
             # Check Python
-            proc = subprocess.run(
-                [python_path, "-c", "import sys; print(sys.version_info[:2])"],
-                capture_output=True, text=True, timeout=5
-            )
-            if proc.returncode == 0:
+            if already_valid:
                 results["details"]["python_valid"] = True
             else:
-                results["details"]["python_valid"] = False
-                results["status"] = "CRITICAL"
-                results["details"]["python_error"] = proc.stderr
+                proc = run_hidden(
+                    [python_path, "-c", "import sys; print(sys.version_info[:2])"],
+                    capture_output=True, text=True, timeout=5
+                )
+                if proc.returncode == 0:
+                    results["details"]["python_valid"] = True
+                else:
+                    results["details"]["python_valid"] = False
+                    results["status"] = "CRITICAL"
+                    results["details"]["python_error"] = proc.stderr
         except Exception as e:
             results["details"]["python_valid"] = False
             results["status"] = "CRITICAL"
@@ -197,7 +207,7 @@ class SystemDetector:
         
         try:
             # Check Pip
-            proc = subprocess.run(
+            proc = run_hidden(
                 [python_path, "-m", "pip", "--version"],
                 capture_output=True, text=True, timeout=10
             )
@@ -212,6 +222,7 @@ class SystemDetector:
             results["status"] = "CRITICAL" if self.is_frozen else "DEGRADED"
             results["details"]["pip_error"] = str(e)
         
+        self._health = results
         return results
 
 
@@ -219,6 +230,7 @@ class SystemDetector:
 _instance = None
 
 def get_detector(app_name: str = "PyScope") -> SystemDetector:
+    """Return the process-wide detector, created lazily on first use."""
     global _instance
     if _instance is None:
         _instance = SystemDetector(app_name)
@@ -1,2 +1,27 @@
-from .main_window import MainWindow, QtTheme
-from .dialogs import PackageDetailsDialog, SearchDialog, ProgressDialog, FastItemDelegate
+import importlib
+
+# Public names resolved on first access (PEP 562) so importing the package
+# does not pull in every widget module up front.
+_lazy_imports = {
+    "MainWindow": ".main_window",
+    "QtTheme": ".main_window",
+    "PackageDetailsDialog": ".dialogs",
+    "SearchDialog": ".dialogs",
+    "ProgressDialog": ".dialogs",
+    "FastItemDelegate": ".dialogs",
+}
+
+__all__ = list(_lazy_imports)
+
+
+def __getattr__(name):
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -2,6 +2,8 @@ import sys
 import threading
 import time
 import os
+import re
+from functools import lru_cache, partial
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QProgressBar, QPlainTextEdit,
     QDialogButtonBox, QWidget, QHBoxLayout, QLineEdit, QPushButton,
@@ -9,9 +11,187 @@ from PySide6.QtWidgets import (
     QMessageBox, QStyledItemDelegate, QStyle
 )
 from PySide6.QtCore import Qt, QTimer, Slot, Signal, QThread, QSize
-from PySide6.QtGui import QColor, QFont, QPainter, QIcon
+from PySide6.QtGui import QColor, QFont, QPainter, QIcon, QImageReader, QPixmap
 
-from ..utils import logger
+from ..utils import logger, run_hidden, json_loads
+
+ICON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "icons")
+
+# Button/window icons are 20-24px; 48px keeps them sharp at 2x scaling
+PRELOAD_ICONS = ("refresh.png", "Add.png", "Search.png", "Packages.png", "Dep.png", "uninstall.png")
+_ICON_SIZE = 48
+_icon_images = {}
+
+def preload_icons(names=PRELOAD_ICONS):
+    """Decode and downscale icons to QImages; safe to call off the GUI thread"""
+    for name in names:
+        reader = QImageReader(os.path.join(ICON_DIR, name))
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(_ICON_SIZE, _ICON_SIZE, Qt.KeepAspectRatio))
+        image = reader.read()
+        if not image.isNull():
+            _icon_images[name] = image
+
+def _installed_distribution(package_name):
+    """Distribution of a package in the running interpreter, or None if it is not installed"""
+    from importlib.metadata import distribution, PackageNotFoundError
+    try:
+        # Direct lookup through the path finders' name index
+        return distribution(package_name)
+    except PackageNotFoundError:
+        # Fall back to a scan of every installed distribution
+        return _get_dist_index().get(_DIST_NAME_SEPARATORS.sub("-", package_name).lower())
+
+_DIST_NAME_SEPARATORS = re.compile(r"[-_.]+")
+_dist_index = None
+# Bumped by clear_dependency_cache so an index built before the clear is not published
+_dist_index_generation = 0
+
+def _get_dist_index():
+    """{normalized name: distribution} for the running interpreter, built once and kept until cleared"""
+    global _dist_index
+    index = _dist_index
+    if index is None:
+        generation = _dist_index_generation
+        from importlib.metadata import distributions
+        index = {}
+        for dist in distributions():
+            # "<name>-<version>.dist-info" already carries the name; only other layouts open METADATA
+            path = getattr(dist, "_path", None)
+            if path is not None and path.suffix == ".dist-info":
+                name = path.name.partition("-")[0]
+            else:
+                name = dist.metadata.get("Name") or ""
+            if name:
+                index.setdefault(_DIST_NAME_SEPARATORS.sub("-", name).lower(), dist)
+        if generation == _dist_index_generation:
+            _dist_index = index
+    return index
+
+def prewarm_dependency_index():
+    """Build the installed-distribution index ahead of the first dependency view.
+
+    Safe to call from a background thread: the index is filled in a local dict
+    and published with one assignment, so concurrent callers at worst build it
+    twice, and an index built across a clear_dependency_cache() is dropped.
+    """
+    _get_dist_index()
+
+def _installed_dependency_names(package_name):
+    """Dependency names of a package in the running interpreter, or None if it is not installed"""
+    dist = _installed_distribution(package_name)
+    if dist is None:
+        return None
+    path = getattr(dist, "_path", None)
+    try:
+        mtime = os.stat(path).st_mtime
+    except (TypeError, OSError):
+        return _dependency_names(dist.requires or [])
+    # A reinstall rewrites the dist-info directory, which changes its mtime
+    return list(_cached_dependency_names(package_name.lower(), str(path), mtime))
+
+@lru_cache(maxsize=256)
+def _cached_dependency_names(name_lower, dist_path, mtime):
+    from importlib.metadata import PathDistribution
+    from pathlib import Path
+    return tuple(_dependency_names(PathDistribution(Path(dist_path)).requires or []))
+
+# {pip command: {normalized name: dependency names}}, or None when pip has no `inspect`
+_inspect_cache = {}
+
+def _inspected_dependency_names(pip_cmd, package_name):
+    """Dependency names of a package in another environment from one cached `pip inspect`, or None"""
+    key = tuple(pip_cmd)
+    if key not in _inspect_cache:
+        index = None
+        result = run_hidden(pip_cmd + ["inspect", "--local"], capture_output=True, text=True, timeout=30, encoding='utf-8', errors='replace')
+        if result.returncode == 0:
+            try:
+                data = json_loads(result.stdout)
+            except ValueError:
+                data = None
+            if isinstance(data, dict):
+                # Markers are evaluated against the target interpreter, not this one
+                environment = data.get("environment") or None
+                index = {}
+                for dist in data.get("installed", []):
+                    metadata = dist.get("metadata", {})
+                    name = metadata.get("name")
+                    if name:
+                        index[_DIST_NAME_SEPARATORS.sub("-", name).lower()] = _dependency_names(metadata.get("requires_dist") or [], environment)
+        _inspect_cache[key] = index
+    index = _inspect_cache[key]
+    if index is None:
+        return None
+    deps = index.get(_DIST_NAME_SEPARATORS.sub("-", package_name).lower())
+    return None if deps is None else list(deps)
+
+def clear_dependency_cache():
+    """Forget parsed dependency lists and the name index (call after installs and uninstalls)"""
+    global _dist_index, _dist_index_generation
+    _dist_index_generation += 1
+    _dist_index = None
+    _cached_dependency_names.cache_clear()
+    _inspect_cache.clear()
+
+def _load_dependency_names(core, env_manager, package_name):
+    """Dependency names of an installed package in the selected environment (runs on a worker)"""
+    if core._targets_running_interpreter():
+        # Same interpreter: read the metadata in-process instead of spawning pip
+        deps = _installed_dependency_names(package_name)
+    else:
+        # Other environment: one `pip inspect` per environment serves every later view
+        deps = _inspected_dependency_names(env_manager.get_pip_command(), package_name)
+    if deps is not None:
+        return deps
+    
+    cmd = env_manager.get_pip_command() + ["show", package_name]
+    result = run_hidden(cmd, capture_output=True, text=True, timeout=10, encoding='utf-8', errors='replace')
+    if result.returncode == 0:
+        for line in result.stdout.split('\n'):
+            if line.lower().startswith("requires:"):
+                deps_str = line.split(":", 1)[1].strip()
+                if deps_str:
+                    return sorted(dict.fromkeys(d.strip() for d in deps_str.split(',') if d.strip()))
+                break
+    return []
+
+# Leading distribution name of a Requires-Dist entry (before extras, specifiers, markers)
+_REQ_NAME_RE = re.compile(r"\s*([A-Za-z0-9_.\-]+)")
+
+def _marker_applies(marker, environment=None):
+    """Evaluate a Requires-Dist environment marker the way pip show does (no extras)"""
+    if not marker.strip():
+        return True
+    try:
+        from packaging.markers import Marker
+    except ImportError:
+        return "extra" not in marker
+    try:
+        return Marker(marker).evaluate({**(environment or {}), "extra": ""})
+    except Exception:
+        return True
+
+def _dependency_names(requirements, environment=None):
+    """Sorted distribution names from Requires-Dist entries that apply here (or in the given marker environment)"""
+    deps = []
+    for req in requirements:
+        spec, _, marker = req.partition(";")
+        if not _marker_applies(marker, environment):
+            continue
+        m = _REQ_NAME_RE.match(spec)
+        if m:
+            deps.append(m.group(1))
+    return sorted(dict.fromkeys(deps))
+
+@lru_cache(maxsize=None)
+def load_icon(name: str) -> QIcon:
+    """Return a shared QIcon for a file in the icons directory"""
+    image = _icon_images.pop(name, None)
+    if image is not None:
+        return QIcon(QPixmap.fromImage(image))
+    return QIcon(os.path.join(ICON_DIR, name))
 
 # --- Workers ---
 
@@ -45,8 +225,7 @@ class SearchWorker(QThread):
         
     def run(self):
         try:
-            json_results = self.core._search_json_api(self.term)
-            results = json_results if json_results else self.core._search_web_scrape(self.term)
+            results = self.core.search_pypi_raw(self.term)
             processed = self.core._process_search_results(results)
             self.results_found.emit(processed)
         except Exception as e:
@@ -68,10 +247,13 @@ class FastItemDelegate(QStyledItemDelegate):
         self.text_outdated = QColor("#ff9800")
         self.text_unknown = QColor("#888888")
         self.text_selected = Qt.black
+        # Status column text -> pen color
+        self.status_colors = {"✓ Updated": self.text_updated, "▲ Outdated": self.text_outdated}
     
     def paint(self, painter, option, index):
         painter.save()
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        text = index.data(Qt.DisplayRole)
         
         # Draw Background
         if option.state & QStyle.State_Selected:
@@ -83,16 +265,13 @@ class FastItemDelegate(QStyledItemDelegate):
             
             # Text Coloring logic
             if index.column() == 3:
-                status = str(index.data(Qt.DisplayRole)).lower()
-                if "updated" in status: text_color = self.text_updated
-                elif "outdated" in status: text_color = self.text_outdated
-                else: text_color = self.text_unknown
+                text_color = self.status_colors.get(text, self.text_unknown)
             else:
                 text_color = self.text_normal
                 
         # Draw Text
         painter.setPen(text_color)
-        text = str(index.data(Qt.DisplayRole))
+        text = str(text)
         
         # Padding and vertical centering
         text_rect = option.rect.adjusted(10, 0, -10, 0)
@@ -123,8 +302,7 @@ class ProgressDialog(QDialog):
 
         self.setWindowTitle(f"{self.action.title()} {self.package_name}{env_text}")
         # Set window icon
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.setWindowIcon(QIcon(os.path.join(base_dir, "icons", "Packages.png")))
+        self.setWindowIcon(load_icon("Packages.png"))
         self.setFixedSize(600, 450)
         layout = QVBoxLayout(self)
         
@@ -249,7 +427,10 @@ class SearchDialog(QDialog):
         btn_layout.addWidget(self.install_btn)
         btn_layout.addWidget(self.close_btn)
         layout.addLayout(btn_layout)
-        self.tree.itemSelectionChanged.connect(lambda: self.install_btn.setEnabled(len(self.tree.selectedItems()) > 0))
+        self.tree.itemSelectionChanged.connect(self._on_selection_changed)
+
+    def _on_selection_changed(self):
+        self.install_btn.setEnabled(len(self.tree.selectedItems()) > 0)
 
     def do_search(self):
         term = self.search_input.text().strip()
@@ -268,10 +449,17 @@ class SearchDialog(QDialog):
         
         self._current_worker = SearchWorker(self.core, term)
         self._current_worker.results_found.connect(self.on_results)
-        self._current_worker.error_occurred.connect(lambda e: QMessageBox.warning(self, "Search Failed", e))
-        self._current_worker.finished.connect(lambda: (self.search_btn.setEnabled(True), self.search_btn.setText("Search")))
+        self._current_worker.error_occurred.connect(self._on_search_error)
+        self._current_worker.finished.connect(self._on_search_finished)
         self._current_worker.start()
 
+    def _on_search_error(self, error):
+        QMessageBox.warning(self, "Search Failed", error)
+
+    def _on_search_finished(self):
+        self.search_btn.setEnabled(True)
+        self.search_btn.setText("Search")
+
     def on_results(self, results):
         for pkg in results:
             item = QTreeWidgetItem([pkg.get("name", ""), f"v{pkg.get('version', '')}", "Installed" if pkg.get("installed", False) else "Available"])
@@ -297,6 +485,11 @@ class SearchDialog(QDialog):
         else:
             super().reject()
 
+_STATUS_LABEL_STYLES = {
+    "Updated": "color: #4caf50;",
+    "Outdated": "color: #ff9800;",
+}
+
 class PackageDetailsDialog(QDialog):
     # Signal to bridge background thread -> main thread
     update_finished = Signal(bool, str)
@@ -304,26 +497,52 @@ class PackageDetailsDialog(QDialog):
 
     def __init__(self, parent=None, package_info=None, core=None, env_manager=None):
         super().__init__(parent)
-        self.package_name = package_info['name']
         self.core = core
         self.env_manager = env_manager
-        self._alive = True
-        self._cancel_event = threading.Event()
         
         self.setup_ui()
         
+        # One timeout timer per dialog; each check restarts it instead of stacking another
+        self._check_timer = QTimer(self)
+        self._check_timer.setSingleShot(True)
+        self._check_timer.setInterval(15000)
+        self._check_timer.timeout.connect(self._check_timeout)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self.refresh_display)
+        
         # Connect signals
         self.update_finished.connect(self._on_status_checked)
         if self.core and hasattr(self.core, 'signals'):
             self.core.signals.package_updated.connect(self.on_global_update)
             
         # Initial display data
+        self.set_package(package_info)
+    
+    def set_package(self, package_info):
+        """Point the dialog at a package so one instance can be reused between opens"""
+        self.package_name = package_info['name']
+        self._alive = True
+        self._cancel_event = threading.Event()
+        
+        self.setWindowTitle(f"{self.package_name}")
+        self.header_lbl.setText(self.package_name)
+        self._check_timer.stop()
+        self.check_btn.setText(" Check")
+        self.check_btn.setEnabled(True)
+        self.update_btn.hide()
         self.refresh_display()
     
     def on_global_update(self, pkg_name):
         """Respond to updates from anywhere in the app"""
-        if pkg_name == self.package_name:
-            self.refresh_display()
+        if pkg_name == self.package_name and self.isVisible():
+            self._schedule_refresh()
+    
+    def _schedule_refresh(self):
+        """Coalesce refresh requests (check callback + package_updated) into one repaint"""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
             
     def refresh_display(self):
         """Fetch fresh data from core and update labels"""
@@ -337,43 +556,44 @@ class PackageDetailsDialog(QDialog):
         self.latest_lbl.setText(pkg['lat'])
         self.status_lbl.setText(pkg['stat'])
         
-        # Update colors
-        if pkg['stat'] == "Updated": 
-            self.status_lbl.setStyleSheet("color: #4caf50;")
-        elif pkg['stat'] == "Outdated": 
-            self.status_lbl.setStyleSheet("color: #ff9800;")
-            if hasattr(self, 'update_btn'): self.update_btn.show()
-        else:
-            self.status_lbl.setStyleSheet("color: #888888;")
+        # Update colors (setStyleSheet re-polishes, so only when the color changes)
+        style = _STATUS_LABEL_STYLES.get(pkg['stat'], "color: #888888;")
+        if self.status_lbl.styleSheet() != style:
+            self.status_lbl.setStyleSheet(style)
+        if pkg['stat'] == "Outdated" and hasattr(self, 'update_btn'):
+            self.update_btn.show()
 
-    def closeEvent(self, event):
-        """Handle dialog closing"""
+    def _deliver_dependencies(self, cancel_event, future):
+        """Future callback (worker thread): hand the dependency list to the GUI thread"""
+        if future.cancelled() or cancel_event.is_set() or not self._alive:
+            return
+        try:
+            deps = future.result()
+        except Exception as e:
+            logger.error("Dep fetch error: %s", e)
+            deps = []
+        self.dependencies_loaded.emit(deps)
+
+    def done(self, result):
+        """Handle dialog closing (Close, X, Update and Uninstall all end here)"""
         self._alive = False
         self._cancel_event.set()
-        
-        try:
-            if self.core and hasattr(self.core, 'signals'):
-                self.core.signals.package_updated.disconnect(self.on_global_update)
-        except: pass
-        
-        event.accept()
+        super().done(result)
     
     def setup_ui(self):
         from PySide6.QtWidgets import QGridLayout
         
-        self.setWindowTitle(f"{self.package_name}")
         # Set window icon
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.setWindowIcon(QIcon(os.path.join(base_dir, "icons", "Packages.png")))
+        self.setWindowIcon(load_icon("Packages.png"))
         self.setMinimumSize(700, 350) # Increased width for better layout w/ Outdated status
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
         layout.setContentsMargins(25, 25, 25, 25)
         
         # Header
-        header = QLabel(self.package_name)
-        header.setStyleSheet("font-size: 22px; font-weight: bold; color: #00a8c8; margin-bottom: 5px;")
-        layout.addWidget(header)
+        self.header_lbl = QLabel()
+        self.header_lbl.setStyleSheet("font-size: 22px; font-weight: bold; color: #00a8c8; margin-bottom: 5px;")
+        layout.addWidget(self.header_lbl)
         
         # Info Card
         info_frame = QFrame()
@@ -411,24 +631,22 @@ class PackageDetailsDialog(QDialog):
         button_layout.setContentsMargins(0, 10, 0, 0)
         
         # Get icon directory path
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        icon_dir = os.path.join(base_dir, "icons")
         
         # Actions
         self.check_btn = QPushButton(" Check")
-        self.check_btn.setIcon(QIcon(os.path.join(icon_dir, "Search.png")))
+        self.check_btn.setIcon(load_icon("Search.png"))
         self.check_btn.setIconSize(QSize(18, 18))
         self.check_btn.setFixedWidth(140)
         self.check_btn.clicked.connect(self.check_status)
         
         self.deps_btn = QPushButton(" Deps")
-        self.deps_btn.setIcon(QIcon(os.path.join(icon_dir, "Dep.png")))
+        self.deps_btn.setIcon(load_icon("Dep.png"))
         self.deps_btn.setIconSize(QSize(18, 18))
         self.deps_btn.setFixedWidth(140)
         self.deps_btn.clicked.connect(self.view_dependencies)
         
         self.uninstall_btn = QPushButton(" Uninstall")
-        self.uninstall_btn.setIcon(QIcon(os.path.join(icon_dir, "uninstall.png")))
+        self.uninstall_btn.setIcon(load_icon("uninstall.png"))
         self.uninstall_btn.setIconSize(QSize(18, 18))
         self.uninstall_btn.setFixedWidth(140)
         self.uninstall_btn.setStyleSheet("background-color: #d32f2f; color: white;")
@@ -436,7 +654,7 @@ class PackageDetailsDialog(QDialog):
 
         # Update button (shown conditionally)
         self.update_btn = QPushButton(" Update")
-        self.update_btn.setIcon(QIcon(os.path.join(icon_dir, "Packages.png")))
+        self.update_btn.setIcon(load_icon("Packages.png"))
         self.update_btn.setIconSize(QSize(18, 18))
         self.update_btn.setFixedWidth(140)
         self.update_btn.setStyleSheet("background-color: #4caf50; color: white;")
@@ -463,24 +681,25 @@ class PackageDetailsDialog(QDialog):
     def check_status(self):
         self.check_btn.setText("Checking...")
         self.check_btn.setEnabled(False)
-        logger.info(f"Starting check for {self.package_name}")
+        logger.info("Starting check for %s", self.package_name)
         
         self.core.check_single_package(
             self.package_name, 
             lambda s, e: self.update_finished.emit(s, str(e) if e else "")
         )
-        QTimer.singleShot(15000, self._check_timeout)
+        self._check_timer.start()
 
     def _check_timeout(self):
         if not self.check_btn.isEnabled():
             self._on_status_checked(False, "Operation timed out")
 
     def _on_status_checked(self, success, error_msg):
+        self._check_timer.stop()
         self.check_btn.setText("🔍 Check")
         self.check_btn.setEnabled(True)
         
         if success: 
-            self.refresh_display()
+            self._schedule_refresh()
         else: 
             if "timed out" not in error_msg:
                  QMessageBox.warning(self, "Check Failed", error_msg or "Unknown error")
@@ -529,35 +748,14 @@ class PackageDetailsDialog(QDialog):
             loading_lbl.hide()
             update_display()
             text_edit.show()
-            try: self.dependencies_loaded.disconnect(on_deps_loaded)
-            except: pass
 
         self.dependencies_loaded.connect(on_deps_loaded)
-
-        def load_task():
-            try:
-                import subprocess
-                pip_cmd = self.env_manager.get_pip_command()
-                cmd = pip_cmd + ["show", self.package_name]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10, encoding='utf-8', errors='replace')
-                
-                final_deps = []
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if line.lower().startswith("requires:"):
-                            parts = line.split(":", 1)
-                            if len(parts) > 1:
-                                deps_str = parts[1].strip()
-                                if deps_str:
-                                    final_deps = sorted([d.strip() for d in deps_str.split(',') if d.strip()])
-                            break
-                            
-                if not self._cancel_event.is_set() and hasattr(self, '_alive') and self._alive:
-                    self.dependencies_loaded.emit(final_deps)
-            except Exception as e: 
-                logger.error(f"Dep fetch error: {e}")
-                if hasattr(self, '_alive') and self._alive and not self._cancel_event.is_set():
-                    self.dependencies_loaded.emit([])
-        
-        threading.Thread(target=load_task, daemon=True).start()
-        deps_dialog.exec()
+        try:
+            future = self.core._submit_task(partial(_load_dependency_names, self.core, self.env_manager, self.package_name))
+            if future is not None:
+                future.add_done_callback(partial(self._deliver_dependencies, self._cancel_event))
+            deps_dialog.exec()
+        finally:
+            # A result that never arrived (window closed first, task dropped) must not reach the next window
+            try: self.dependencies_loaded.disconnect(on_deps_loaded)
+            except (RuntimeError, TypeError): pass
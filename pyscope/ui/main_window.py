@@ -4,18 +4,48 @@ import hashlib
 import time
 import os
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QLineEdit, QComboBox,
-    QProgressBar, QStatusBar, QMessageBox, QTreeView,
-    QAbstractItemView, QHeaderView, QDialog, QListView
+    QProgressBar, QStatusBar, QTreeView,
+    QAbstractItemView, QHeaderView, QListView
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QObject, QThread, QSortFilterProxyModel, QRegularExpression, QMetaObject, Slot, QSize
-from PySide6.QtGui import QFont, QColor, QPalette, QStandardItemModel, QStandardItem, QIcon
+from PySide6.QtCore import Qt, QTimer, Signal, QObject, QSortFilterProxyModel, QMetaObject, Slot, QSize
+from PySide6.QtGui import QFont, QColor, QPalette, QStandardItemModel, QStandardItem
 
 from ..core import PackageManagerCore
 from ..environments import EnvironmentManager
 from ..utils import logger
-from .dialogs import FastItemDelegate, ProgressDialog, SearchDialog, PackageDetailsDialog, GenericWorker
+from .dialogs import FastItemDelegate, ProgressDialog, SearchDialog, PackageDetailsDialog, GenericWorker, ICON_DIR, load_icon, clear_dependency_cache
+
+# Status column text and color per package status, shared by every row writer
+_STATUS_META = {
+    "Updated": ("✓ Updated", QColor("#4caf50")),
+    "Outdated": ("▲ Outdated", QColor("#ff9800")),
+}
+_UNKNOWN_STATUS_META = ("[--] Unknown", QColor("#888888"))
+
+_FILTER_BTN_ACTIVE_STYLE = """
+    QPushButton {
+        background-color: #00a8c8;
+        color: black;
+        border: none;
+        padding: 6px 18px;
+        border-radius: 6px;
+        font-weight: bold;
+    }
+"""
+_FILTER_BTN_IDLE_STYLE = """
+    QPushButton {
+        background-color: transparent;
+        color: #00a8c8;
+        border: 1px solid #00a8c8;
+        padding: 6px 18px;
+        border-radius: 6px;
+    }
+    QPushButton:hover {
+        background-color: rgba(0, 168, 200, 0.1);
+    }
+"""
 
 # --- Signals ---
 
@@ -44,16 +74,16 @@ class PackageFilterProxy(QSortFilterProxyModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.filter_mode = "All"
-        self.search_term = ""
+        # Names matching the active search (matched off the UI thread); None = no search
+        self.search_names = None
 
     def filterAcceptsRow(self, source_row, source_parent):
         model = self.sourceModel()
         if not model: return True
         
         # 1. Search Filter (Column 0: Name)
-        if self.search_term:
-            name = model.item(source_row, 0).text().lower()
-            if self.search_term not in name:
+        if self.search_names is not None:
+            if model.item(source_row, 0).text() not in self.search_names:
                 return False
                 
         # 2. Status Filter (Check data in model instead of text for robustness)
@@ -94,12 +124,14 @@ class QtTheme(QObject):
             "progress_bg": "#2a2a2a",
             "progress_fg": "#00a8c8"
         }
+        self._stylesheet = None
     
     def apply_to_app(self, app):
         """Apply theme to QApplication instance"""
-        from PySide6.QtWidgets import QStyleFactory
-        if "Fusion" in QStyleFactory.keys():
-            app.setStyle(QStyleFactory.create("Fusion"))
+        if app.style().name().lower() != "fusion":
+            from PySide6.QtWidgets import QStyleFactory
+            if "Fusion" in QStyleFactory.keys():
+                app.setStyle(QStyleFactory.create("Fusion"))
         
         self.apply_palette(app)
         self.apply_stylesheet(app)
@@ -107,33 +139,44 @@ class QtTheme(QObject):
         
     def apply_palette(self, app):
         """Apply color palette to application"""
+        c = self.COLORS
         palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(self.COLORS["bg"]))
-        palette.setColor(QPalette.WindowText, QColor(self.COLORS["text"]))
-        palette.setColor(QPalette.Base, QColor(self.COLORS["card"]))
-        palette.setColor(QPalette.AlternateBase, QColor(self.COLORS["surface"]))
-        palette.setColor(QPalette.ToolTipBase, QColor(self.COLORS["accent"]))
+        palette.setColor(QPalette.Window, QColor(c["bg"]))
+        palette.setColor(QPalette.WindowText, QColor(c["text"]))
+        palette.setColor(QPalette.Base, QColor(c["card"]))
+        palette.setColor(QPalette.AlternateBase, QColor(c["surface"]))
+        palette.setColor(QPalette.ToolTipBase, QColor(c["accent"]))
         palette.setColor(QPalette.ToolTipText, Qt.white)
-        palette.setColor(QPalette.Text, QColor(self.COLORS["text"]))
-        palette.setColor(QPalette.Button, QColor(self.COLORS["surface"]))
-        palette.setColor(QPalette.ButtonText, QColor(self.COLORS["text"]))
+        palette.setColor(QPalette.Text, QColor(c["text"]))
+        palette.setColor(QPalette.Button, QColor(c["surface"]))
+        palette.setColor(QPalette.ButtonText, QColor(c["text"]))
         palette.setColor(QPalette.BrightText, Qt.red)
-        palette.setColor(QPalette.Link, QColor(self.COLORS["accent"]))
-        palette.setColor(QPalette.Highlight, QColor(self.COLORS["accent"]))
+        palette.setColor(QPalette.Link, QColor(c["accent"]))
+        palette.setColor(QPalette.Highlight, QColor(c["accent"]))
         palette.setColor(QPalette.HighlightedText, Qt.black)
-        palette.setColor(QPalette.Disabled, QPalette.Text, QColor(self.COLORS["subtext"]))
-        palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(self.COLORS["subtext"]))
+        palette.setColor(QPalette.Disabled, QPalette.Text, QColor(c["subtext"]))
+        palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(c["subtext"]))
         app.setPalette(palette)
 
     def apply_stylesheet(self, app):
         """Apply CSS stylesheet"""
-        stylesheet = f"""
-        QMainWindow {{ background-color: {self.COLORS["bg"]}; }}
-        QWidget {{ color: {self.COLORS["text"]}; font-family: 'Segoe UI'; }}
+        stylesheet = self.stylesheet()
+        # Re-setting an identical sheet still re-polishes every widget
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
+
+    def stylesheet(self) -> str:
+        """Build the application stylesheet once per theme instance"""
+        if self._stylesheet is not None:
+            return self._stylesheet
+        c = self.COLORS
+        self._stylesheet = f"""
+        QMainWindow {{ background-color: {c["bg"]}; }}
+        QWidget {{ color: {c["text"]}; font-family: 'Segoe UI'; }}
         
         /* Buttons */
         QPushButton {{ 
-            background-color: {self.COLORS["accent"]}; 
+            background-color: {c["accent"]}; 
             color: white; 
             border: none; 
             padding: 10px 20px; 
@@ -141,32 +184,32 @@ class QtTheme(QObject):
             font-weight: bold; 
             font-size: 13px;
         }}
-        QPushButton:hover {{ background-color: {self.COLORS["accent_hover"]}; }}
+        QPushButton:hover {{ background-color: {c["accent_hover"]}; }}
         QPushButton:pressed {{ background-color: #00838f; }}
-        QPushButton:disabled {{ background-color: {self.COLORS["surface"]}; color: {self.COLORS["subtext"]}; border: 1px solid {self.COLORS["border"]}; }}
+        QPushButton:disabled {{ background-color: {c["surface"]}; color: {c["subtext"]}; border: 1px solid {c["border"]}; }}
         
         /* Inputs */
         QLineEdit {{ 
-            background-color: {self.COLORS["card"]}; 
+            background-color: {c["card"]}; 
             color: white; 
-            border: 1px solid {self.COLORS["border"]}; 
+            border: 1px solid {c["border"]}; 
             border-radius: 6px; 
             padding: 8px; 
-            selection-background-color: {self.COLORS["accent"]}; 
+            selection-background-color: {c["accent"]}; 
         }}
-        QLineEdit:focus {{ border: 1px solid {self.COLORS["accent"]}; }}
+        QLineEdit:focus {{ border: 1px solid {c["accent"]}; }}
         
         QComboBox {{ 
-            background-color: {self.COLORS["card"]}; 
+            background-color: {c["card"]}; 
             color: white; 
-            border: 1px solid {self.COLORS["border"]}; 
+            border: 1px solid {c["border"]}; 
             border-radius: 8px; 
             padding: 8px 12px; 
             min-height: 28px;
             font-size: 12px;
         }}
-        QComboBox:hover {{ border: 1px solid {self.COLORS["accent"]}; }}
-        QComboBox:on {{ border: 1px solid {self.COLORS["accent"]}; border-bottom-left-radius: 0px; border-bottom-right-radius: 0px; }}
+        QComboBox:hover {{ border: 1px solid {c["accent"]}; }}
+        QComboBox:on {{ border: 1px solid {c["accent"]}; border-bottom-left-radius: 0px; border-bottom-right-radius: 0px; }}
         QComboBox::drop-down {{ 
             border: none; 
             width: 30px;
@@ -175,17 +218,17 @@ class QtTheme(QObject):
             image: none;
             border-left: 5px solid transparent;
             border-right: 5px solid transparent;
-            border-top: 5px solid {self.COLORS["subtext"]};
+            border-top: 5px solid {c["subtext"]};
             margin-right: 10px;
         }}
-        QComboBox::down-arrow:hover {{ border-top-color: {self.COLORS["accent"]}; }}
+        QComboBox::down-arrow:hover {{ border-top-color: {c["accent"]}; }}
         
         QComboBox QAbstractItemView {{
-            background-color: {self.COLORS["surface"]};
-            color: {self.COLORS["text"]};
-            selection-background-color: {self.COLORS["accent"]};
+            background-color: {c["surface"]};
+            color: {c["text"]};
+            selection-background-color: {c["accent"]};
             selection-color: black;
-            border: 1px solid {self.COLORS["accent"]};
+            border: 1px solid {c["accent"]};
             border-top: none;
             outline: none;
             padding: 4px;
@@ -193,44 +236,44 @@ class QtTheme(QObject):
         QComboBox QAbstractItemView::item {{
             min-height: 45px;
             padding-left: 15px;
-            border-bottom: 1px solid {self.COLORS["border"]};
+            border-bottom: 1px solid {c["border"]};
         }}
         QComboBox QAbstractItemView::item:selected {{
-            background-color: {self.COLORS["accent"]};
+            background-color: {c["accent"]};
             color: black;
             border-radius: 4px;
         }}
         QComboBox QAbstractItemView::item:hover {{
             background-color: rgba(0, 168, 200, 0.15);
-            color: {self.COLORS["accent"]};
+            color: {c["accent"]};
         }}
         
         /* Specialized Refresh Button */
         #env_refresh_btn {{
-            background-color: {self.COLORS["surface"]};
-            border: 1px solid {self.COLORS["border"]};
-            color: {self.COLORS["accent"]};
+            background-color: {c["surface"]};
+            border: 1px solid {c["border"]};
+            color: {c["accent"]};
             font-size: 16px;
             padding: 0px;
             border-radius: 6px;
         }}
         #env_refresh_btn:hover {{
-            border-color: {self.COLORS["accent"]};
-            background-color: {self.COLORS["card"]};
+            border-color: {c["accent"]};
+            background-color: {c["card"]};
         }}
         
         /* Lists & Trees */
         QTreeWidget, QTreeView, QListWidget {{ 
-            background-color: {self.COLORS["surface"]}; 
-            alternate-background-color: {self.COLORS["card"]}; 
-            color: {self.COLORS["text"]}; 
-            border: 1px solid {self.COLORS["border"]}; 
+            background-color: {c["surface"]}; 
+            alternate-background-color: {c["card"]}; 
+            color: {c["text"]}; 
+            border: 1px solid {c["border"]}; 
             border-radius: 6px; 
             outline: none;
         }}
         QHeaderView::section {{ 
-            background-color: {self.COLORS["bg"]}; 
-            color: {self.COLORS["subtext"]}; 
+            background-color: {c["bg"]}; 
+            color: {c["subtext"]}; 
             padding: 10px; 
             border: none; 
             font-weight: bold; 
@@ -240,29 +283,29 @@ class QtTheme(QObject):
         
         /* Progress & Status */
         QProgressBar {{ 
-            border: 1px solid {self.COLORS["border"]}; 
+            border: 1px solid {c["border"]}; 
             border-radius: 4px; 
             text-align: center; 
             color: white; 
-            background-color: {self.COLORS["progress_bg"]}; 
+            background-color: {c["progress_bg"]}; 
         }}
-        QProgressBar::chunk {{ background-color: {self.COLORS["progress_fg"]}; border-radius: 3px; }}
-        QStatusBar {{ background-color: {self.COLORS["surface"]}; color: {self.COLORS["subtext"]}; border-top: 1px solid {self.COLORS["border"]}; }}
+        QProgressBar::chunk {{ background-color: {c["progress_fg"]}; border-radius: 3px; }}
+        QStatusBar {{ background-color: {c["surface"]}; color: {c["subtext"]}; border-top: 1px solid {c["border"]}; }}
         
         /* Text Areas */
         QPlainTextEdit {{ 
-            background-color: {self.COLORS["card"]}; 
-            color: {self.COLORS["text"]}; 
-            border: 1px solid {self.COLORS["border"]}; 
+            background-color: {c["card"]}; 
+            color: {c["text"]}; 
+            border: 1px solid {c["border"]}; 
             border-radius: 6px; 
         }}
         
         /* Scrollbars (Subtle) */
-        QScrollBar:vertical {{ border: none; background: {self.COLORS["bg"]}; width: 10px; margin: 0px; }}
+        QScrollBar:vertical {{ border: none; background: {c["bg"]}; width: 10px; margin: 0px; }}
         QScrollBar::handle:vertical {{ background: #333; min-height: 20px; border-radius: 5px; }}
         QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
         """
-        app.setStyleSheet(stylesheet)
+        return self._stylesheet
 
 # --- Main Window ---
 
@@ -271,20 +314,32 @@ class MainWindow(QMainWindow):
     
     package_loaded = Signal()
     status_changed = Signal(str)
+    search_results_ready = Signal(str, object) # search term, set of matching names
+    package_rechecked = Signal(str) # package name, after a post-update check
     
     def __init__(self):
         super().__init__()
         self.theme = QtTheme()
         self.core = PackageManagerCore()
         self.env_manager = EnvironmentManager()
+        self._env_id_cache = {}
+        self._env_entries = None
         self.current_env_id = self._get_environment_id()
         self.core.set_pip_command(self.env_manager.get_pip_command())
         self.update_in_progress = False
         self.active_dialogs = {}
+        self._details_dialog = None
         self.pending_updates = []
         self.filter_buttons = {}
+        self._active_filter = "All"
         self._load_session = 0
         self._refresh_pending = False
+        self._pkg_snapshot = None
+        self._pkg_snapshot_version = -1
+        self._rendered_version = -1  # data_version last written into the model
+        self._row_index = {}  # package name -> column 0 item of its row
+        self._stats_total = 0
+        self._stats_outdated = 0
         self.setup_window()
         self.core.signals = CoreSignals()
         
@@ -293,6 +348,13 @@ class MainWindow(QMainWindow):
         self._search_debounce_timer.setSingleShot(True)
         self._search_debounce_timer.timeout.connect(self._apply_search_to_proxy)
         
+        # Per-package check results are applied in batches
+        self._pending_pkg_updates = set()
+        self._pkg_flush_timer = QTimer()
+        self._pkg_flush_timer.setSingleShot(True)
+        self._pkg_flush_timer.setInterval(100)
+        self._pkg_flush_timer.timeout.connect(self._flush_pending_updates)
+        
         # UI state generation
         self._ui_generation = 0
         
@@ -311,11 +373,16 @@ class MainWindow(QMainWindow):
             # Shutdown core
             if self.core:
                 self.core.shutdown()
+            
+            # Let background workers finish so Qt doesn't destroy running threads
+            for worker in (getattr(self, 'worker', None), getattr(self, 'env_worker', None)):
+                if worker and worker.isRunning():
+                    worker.wait()
                 
             # Allow event to propagate
             event.accept()
         except Exception as e:
-            logger.error(f"Error during shutdown: {e}")
+            logger.error("Error during shutdown: %s", e)
             event.accept()
 
     def setup_window(self):
@@ -323,15 +390,18 @@ class MainWindow(QMainWindow):
         self.resize(1100, 750)
         self.setMinimumSize(900, 600)
         
-        # Set window icon for taskbar and window frame
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        icon_path = os.path.join(base_dir, "icons", "logo.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        # Set window icon for taskbar and window frame (app.py normally sets it app-wide)
+        if QApplication.windowIcon().isNull() and os.path.exists(os.path.join(ICON_DIR, "logo.ico")):
+            self.setWindowIcon(load_icon("logo.ico"))
 
     def _get_environment_id(self):
         path = self.env_manager.get_python_command()
-        return hashlib.md5(path.encode()).hexdigest()
+        env_id = self._env_id_cache.get(path)
+        if env_id is None:
+            # Only used as an in-memory cache key, so a short blake2b digest is enough
+            env_id = hashlib.blake2b(path.encode("utf-8"), digest_size=8).hexdigest()
+            self._env_id_cache[path] = env_id
+        return env_id
 
     def setup_ui(self):
         # Add auto-check timer
@@ -340,8 +410,8 @@ class MainWindow(QMainWindow):
         self.auto_check_timer.timeout.connect(self._auto_check_loaded)
         self.auto_check_timer.start(2000)  # 2 seconds check
 
+        # Built detached and attached once complete, so the window lays out a finished tree
         central = QWidget()
-        self.setCentralWidget(central)
         layout = QVBoxLayout(central)
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(15)
@@ -398,12 +468,8 @@ class MainWindow(QMainWindow):
         self.environment_combo.currentIndexChanged.connect(self.on_environment_changed)
         top_bar.addWidget(self.environment_combo)
         
-        # Get the base directory (where this file is located, go up 2 levels to reach project root)
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        icon_dir = os.path.join(base_dir, "icons")
-        
         self.refresh_envs_btn = QPushButton()
-        self.refresh_envs_btn.setIcon(QIcon(os.path.join(icon_dir, "refresh.png")))
+        self.refresh_envs_btn.setIcon(load_icon("refresh.png"))
         self.refresh_envs_btn.setIconSize(QSize(24, 24))
         self.refresh_envs_btn.setObjectName("env_refresh_btn")
         self.refresh_envs_btn.setFixedSize(40, 40)
@@ -415,10 +481,10 @@ class MainWindow(QMainWindow):
         self.search_input.setPlaceholderText("Search installed packages...")
         self.search_input.setFixedWidth(250)
         # Use debounce instead of immediate refresh for search
-        self.search_input.textChanged.connect(lambda: self._search_debounce_timer.start(200))
+        self.search_input.textChanged.connect(self._on_search_text_changed)
         top_bar.addWidget(self.search_input)
         self.add_btn = QPushButton(" Install Package")
-        self.add_btn.setIcon(QIcon(os.path.join(icon_dir, "Add.png")))
+        self.add_btn.setIcon(load_icon("Add.png"))
         self.add_btn.setIconSize(QSize(20, 20))
         self.add_btn.clicked.connect(self.open_search)
         top_bar.addWidget(self.add_btn)
@@ -440,7 +506,7 @@ class MainWindow(QMainWindow):
         self.stats_label.setStyleSheet("color: #888888; font-weight: bold;")
         filter_bar.addWidget(self.stats_label)
         self.check_btn = QPushButton(" Check for Updates")
-        self.check_btn.setIcon(QIcon(os.path.join(icon_dir, "Search.png")))
+        self.check_btn.setIcon(load_icon("Search.png"))
         self.check_btn.setIconSize(QSize(20, 20))
         self.check_btn.clicked.connect(self.check_updates)
         filter_bar.addWidget(self.check_btn)
@@ -455,11 +521,10 @@ class MainWindow(QMainWindow):
         self.progress_bar.setFixedHeight(6)
         prog_layout.addWidget(self.progress_bar)
         layout.addWidget(self.progress_section)
+        self.setCentralWidget(central)
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
-        self.status_bar.showMessage("Ready")
-        self.status_bar.showMessage("Ready")
         self.refresh_environments()
         
         # Initialize styles and filter (Must be called after all UI elements are created)
@@ -467,7 +532,7 @@ class MainWindow(QMainWindow):
 
     def _auto_check_loaded(self):
         """Check if packages are loaded and retry if needed."""
-        packages, total, outdated = self.core.refresh_packages_data()
+        packages, total, outdated = self._snapshot()
         
         if total == 0 and not hasattr(self, '_auto_retry_count'):
             self._auto_retry_count = 1
@@ -475,7 +540,7 @@ class MainWindow(QMainWindow):
             self.load_packages()
         elif total > 0 and not hasattr(self, '_ui_initialized'):
             self._ui_initialized = True
-            logger.info(f"✅ Auto-detected {total} packages, refreshing UI...")
+            logger.info("✅ Auto-detected %s packages, refreshing UI...", total)
             self.refresh_tree()
 
     def create_package_view(self):
@@ -485,6 +550,8 @@ class MainWindow(QMainWindow):
         view.setSelectionBehavior(QAbstractItemView.SelectRows)
         view.setSelectionMode(QAbstractItemView.SingleSelection)
         view.setItemDelegate(FastItemDelegate(view))
+        # FastItemDelegate gives every row the same height; let the view measure only once
+        view.setUniformRowHeights(True)
         
         model = QStandardItemModel(0, 4)
         model.setHorizontalHeaderLabels(["Package", "Version", "Latest", "Status"])
@@ -503,8 +570,11 @@ class MainWindow(QMainWindow):
         return view, model, proxy
 
     def setup_signals(self):
-        self.core.signals.check_started.connect(lambda: (self.progress_bar.setRange(0, 0), self.progress_bar.setValue(0)))
+        self.core.signals.check_started.connect(self._on_check_started)
+        self.search_results_ready.connect(self._on_search_results)
+        self.package_rechecked.connect(self._on_package_rechecked)
         self.core.signals.package_updated.connect(self.on_package_checked)
+        self.core.signals.package_updated.connect(self._advance_check_progress)
         self.core.signals.check_finished.connect(self.on_update_check_finished)
         self.core.signals.operation_progress.connect(self.on_operation_progress)
         self.core.signals.operation_completed.connect(self.on_operation_completed)
@@ -531,7 +601,6 @@ class MainWindow(QMainWindow):
             environment_id=self.current_env_id,
             force_refresh=force_refresh
         )
-        self.worker.finished.connect(lambda x: None)
         self.worker.start()
 
     @Slot()
@@ -550,32 +619,47 @@ class MainWindow(QMainWindow):
         self._refresh_pending = True
         QTimer.singleShot(50, self._do_refresh_tree)
         
+    def _snapshot(self):
+        """(packages, total, outdated) from core, recomputed only when core data changed"""
+        version = self.core.data_version
+        if version != self._pkg_snapshot_version:
+            self._pkg_snapshot = self.core.refresh_packages_data()
+            self._pkg_snapshot_version = version
+        return self._pkg_snapshot
+
     def _do_do_refresh_stats(self):
         """Update stats label with latest core data"""
-        packages, total, outdated = self.core.refresh_packages_data()
-        self.stats_label.setText(f"Packages: {total} | Updates: {outdated} | {self.env_manager.get_current_display()}")
+        packages, self._stats_total, self._stats_outdated = self._snapshot()
+        self._show_stats()
+
+    def _show_stats(self):
+        self.stats_label.setText(f"Packages: {self._stats_total} | Updates: {self._stats_outdated} | {self.env_manager.get_current_display()}")
 
     def _do_refresh_tree(self):
         """Actually perform the tree refresh"""
         self._refresh_pending = False
-        self._do_do_refresh_stats()
         
-        # Update model in UI thread
+        # Update model (and stats label) in UI thread
         self._update_tree_model()
         
     def _update_tree_model(self):
         """Update tree model efficiently (Single source of truth) - NON-BLOCKING"""
         try:
             # Get latest data from core
-            packages, total, outdated = self.core.refresh_packages_data()
+            packages, total, outdated = self._snapshot()
             
             # Update Statistics Label
-            self.stats_label.setText(f"Packages: {total} | Updates: {outdated} | {self.env_manager.get_current_display()}")
+            self._do_do_refresh_stats()
+            
+            # Nothing changed in core since the model was last filled: skip the re-render
+            if self._pkg_snapshot_version == self._rendered_version and self.model.rowCount() == total:
+                return
+            self._rendered_version = self._pkg_snapshot_version
             
             if total == 0:
-                if self.model.rowCount() > 0:
-                    self.model.removeRows(0, self.model.rowCount())
+                self._clear_rows()
                 self.stats_label.setText("❌ No packages installed")
+                self._thaw_view()
                 return
 
             current_count = self.model.rowCount()
@@ -594,9 +678,7 @@ class MainWindow(QMainWindow):
                 # Then add new rows if needed (incrementally, not rebuild!)
                 if new_count > current_count:
                     for i in range(current_count, new_count):
-                        row = [QStandardItem(), QStandardItem(), QStandardItem(), QStandardItem()]
-                        self.model.appendRow(row)
-                        self._set_row_data(self.model.rowCount() - 1, packages[i])
+                        self.model.appendRow(self._make_row(packages[i]))
                 
                 # Or remove extra rows if needed (from the end)
                 elif new_count < current_count:
@@ -604,57 +686,95 @@ class MainWindow(QMainWindow):
 
             # Invalidate proxy to trigger re-filtering
             self.proxy.invalidateFilter()
-            logger.debug(f"✅ UI updated: {total} packages in model")
+            if self.proxy.search_names is not None:
+                # Re-match the active search against the new package list
+                self._apply_search_to_proxy()
+            logger.debug("✅ UI updated: %s packages in model", total)
             
         except Exception as e:
-            logger.error(f"❌ UI Update failed: {e}")
+            logger.error("❌ UI Update failed: %s", e)
     
     def _update_rows_chunk(self, packages, start_index, session_id, chunk_size=50):
         """Update rows in chunks to avoid UI freeze during refresh"""
-        if session_id != self._load_session or start_index >= len(packages):
+        if session_id != self._load_session:
+            return
+        if start_index >= len(packages):
+            self._thaw_view()
             return
+        if start_index == 0:
+            self._freeze_view()
         end_index = min(start_index + chunk_size, len(packages))
         for i in range(start_index, end_index):
             if i < self.model.rowCount():
                 self._set_row_data(i, packages[i])
         if end_index < len(packages):
-            QTimer.singleShot(5, lambda: self._update_rows_chunk(packages, end_index, session_id, chunk_size))
+            QTimer.singleShot(0, lambda: self._update_rows_chunk(packages, end_index, session_id, chunk_size))
+        else:
+            self._thaw_view()
 
     def _set_row_data(self, row_idx, pkg):
         """Efficiently update a single row without rebuilding"""
+        self._fill_row([self.model.item(row_idx, col) for col in range(4)], pkg)
+
+    def _make_row(self, pkg):
+        """Build a fully populated row before it is inserted (one rowsInserted, no dataChanged)"""
+        row = [QStandardItem(), QStandardItem(), QStandardItem(), QStandardItem()]
+        self._fill_row(row, pkg)
+        return row
+
+    def _fill_row(self, row, pkg):
+        """Populate the four column items of a row from a package dict"""
         # Package Name (Col 0)
-        self.model.item(row_idx, 0).setText(pkg["name"])
-        self.model.item(row_idx, 0).setData(pkg, Qt.UserRole)
+        row[0].setText(pkg["name"])
+        row[0].setData(pkg, Qt.UserRole)
+        self._row_index[pkg["name"]] = row[0]
         
         # Version (Col 1)
-        self.model.item(row_idx, 1).setText(f"v{pkg['ver']}")
+        row[1].setText(f"v{pkg['ver']}")
         
         # Latest (Col 2)
-        self.model.item(row_idx, 2).setText(pkg["lat"])
+        row[2].setText(pkg["lat"])
         
         # Status (Col 3)
-        status = pkg["stat"]
-        status_item = self.model.item(row_idx, 3)
-        if status == "Updated":
-            status_item.setText("✓ Updated")
-            status_item.setForeground(QColor("#4caf50"))
-        elif status == "Outdated":
-            status_item.setText("▲ Outdated")
-            status_item.setForeground(QColor("#ff9800"))
-        else:
-            status_item.setText("[--] Unknown")
-            status_item.setForeground(QColor("#888888"))
+        self._set_status_cell(row[3], pkg["stat"])
+
+    def _row_of(self, pkg_name):
+        """Model row currently showing pkg_name, or -1"""
+        item = self._row_index.get(pkg_name)
+        # Rows are rewritten in place, so an entry may now show another package
+        if item is None or not shiboken6.isValid(item) or item.text() != pkg_name:
+            return -1
+        return item.row()
+
+    def _clear_rows(self):
+        if self.model.rowCount() > 0:
+            self.model.removeRows(0, self.model.rowCount())
+        self._row_index.clear()
+        self._rendered_version = -1
+
+    def _set_status_cell(self, status_item, status):
+        text, color = _STATUS_META.get(status, _UNKNOWN_STATUS_META)
+        status_item.setText(text)
+        status_item.setForeground(color)
 
     def _load_model_chunk(self, items, start_index, session_id, chunk_size=50):
-        if session_id != self._load_session or start_index >= len(items): return
+        if session_id != self._load_session: return
+        if start_index >= len(items): return self._thaw_view()
+        if start_index == 0: self._freeze_view()
         end_index = min(start_index + chunk_size, len(items))
         for i in range(start_index, end_index):
-            pkg = items[i]
-            row = [QStandardItem(), QStandardItem(), QStandardItem(), QStandardItem()]
-            self.model.appendRow(row)
-            self._set_row_data(self.model.rowCount() - 1, pkg)
+            self.model.appendRow(self._make_row(items[i]))
             
-        if end_index < len(items): QTimer.singleShot(10, lambda: self._load_model_chunk(items, end_index, session_id, chunk_size))
+        if end_index < len(items): QTimer.singleShot(0, lambda: self._load_model_chunk(items, end_index, session_id, chunk_size))
+        else: self._thaw_view()
+
+    def _freeze_view(self):
+        """Suspend view repaints while a chunked load is in flight"""
+        self.view.setUpdatesEnabled(False)
+
+    def _thaw_view(self):
+        """Resume view repaints and paint the finished batch once"""
+        self.view.setUpdatesEnabled(True)
 
     def _apply_search_filter(self):
         """Local filtering without reloading from system"""
@@ -663,7 +783,7 @@ class MainWindow(QMainWindow):
             return
             
         search_term = self.search_input.text().strip().lower()
-        filter_mode = next((k for k, v in self.filter_buttons.items() if v.isChecked()), "All")
+        filter_mode = self._active_filter
         
         # Filter local package list (No pipe list)
         filtered = self.core.filter_packages(filter_mode)
@@ -677,8 +797,7 @@ class MainWindow(QMainWindow):
         # User's request implies we are showing "results".
         
         # CLEAR MODEL first
-        if self.model.rowCount() > 0:
-             self.model.removeRows(0, self.model.rowCount())
+        self._clear_rows()
         
         # Re-populate incrementally
         session = time.time()
@@ -686,7 +805,7 @@ class MainWindow(QMainWindow):
         self._load_model_chunk(filtered, 0, session, 50)
         
         # Ensure proxy doesn't double-filter
-        self.proxy.search_term = ""
+        self.proxy.search_names = None
         self.proxy.filter_mode = "All"
         self.proxy.invalidateFilter()
         
@@ -698,34 +817,15 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage(f"Found {count} packages", 2000)
 
     def apply_filter(self, mode):
+        self._active_filter = mode
         self.proxy.filter_mode = mode
         for k, v in self.filter_buttons.items():
             is_selected = (k == mode)
             v.setChecked(is_selected)
-            if is_selected:
-                v.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00a8c8;
-                        color: black;
-                        border: none;
-                        padding: 6px 18px;
-                        border-radius: 6px;
-                        font-weight: bold;
-                    }
-                """)
-            else:
-                v.setStyleSheet("""
-                    QPushButton {
-                        background-color: transparent;
-                        color: #00a8c8;
-                        border: 1px solid #00a8c8;
-                        padding: 6px 18px;
-                        border-radius: 6px;
-                    }
-                    QPushButton:hover {
-                        background-color: rgba(0, 168, 200, 0.1);
-                    }
-                """)
+            style = _FILTER_BTN_ACTIVE_STYLE if is_selected else _FILTER_BTN_IDLE_STYLE
+            # setStyleSheet re-polishes the button even when nothing changed
+            if v.styleSheet() != style:
+                v.setStyleSheet(style)
         
         # Fast Filtering: Directly invalidate proxy to trigger filter logic immediately
         self.proxy.invalidateFilter()
@@ -766,46 +866,67 @@ class MainWindow(QMainWindow):
             if getattr(self, '_update_check_generation', 0) != expected_gen:
                 return  # Abandon: stale callback
             QMetaObject.invokeMethod(self, "on_update_check_finished", Qt.QueuedConnection)
-            
-        def safe_package(pkg_name):
-            if getattr(self, '_update_check_generation', 0) != expected_gen:
-                return  # Abandon: stale callback
-            self.on_package_checked(pkg_name)
         
-        self.core.check_updates(
-            ui_finish_callback=safe_finish,
-            ui_package_callback=safe_package
-        )
+        # Row updates arrive through the package_updated signal (UI thread only)
+        self.core.check_updates(ui_finish_callback=safe_finish)
 
     def on_package_checked(self, pkg_name):
-        pkg = self.core.get_package_by_name(pkg_name)
-        if not pkg: return
-        for i in range(self.model.rowCount()):
-            if self.model.item(i, 0).text() == pkg_name:
-                self.model.item(i, 0).setData(pkg, Qt.UserRole)  # Fix: Update data for proxy filter
-                self.model.item(i, 2).setText(pkg["lat"])
-                if pkg["stat"] == "Outdated":
-                    self.model.item(i, 3).setText("▲ Outdated")
-                    self.model.item(i, 3).setForeground(QColor("#ff9800"))
-                elif pkg["stat"] == "Updated":
-                    self.model.item(i, 3).setText("✓ Updated")
-                    self.model.item(i, 3).setForeground(QColor("#4caf50"))
-                
-                # Trigger filter update if needed
-                if self.proxy.filter_mode != "All":
-                    self.proxy.invalidateFilter()
-                break
+        """Queue a checked package; rows are refreshed together on the next flush"""
+        self._pending_pkg_updates.add(pkg_name)
+        if not self._pkg_flush_timer.isActive():
+            self._pkg_flush_timer.start()
+
+    def _flush_pending_updates(self):
+        """Apply all queued package results in one pass over the model"""
+        self._pkg_flush_timer.stop()
+        pending = self._pending_pkg_updates
+        if not pending:
+            return
+        self._pending_pkg_updates = set()
+        
+        # Large batches (e.g. the final flush of a check) repaint once at the end;
+        # a running chunked load may already have the view frozen
+        bulk = len(pending) > 20 and self.view.updatesEnabled()
+        if bulk:
+            self._freeze_view()
+        outdated_text = _STATUS_META["Outdated"][0]
+        for pkg in self.core.get_packages_by_names(pending):
+            row_idx = self._row_of(pkg["name"])
+            if row_idx >= 0:
+                # Adjust the outdated count by what this row showed before
+                was_outdated = self.model.item(row_idx, 3).text() == outdated_text
+                self._stats_outdated += (pkg["stat"] == "Outdated") - was_outdated
+                self._set_row_data(row_idx, pkg)
+        if bulk:
+            self._thaw_view()
+        
+        # Trigger filter update if needed
+        if self.proxy.filter_mode != "All":
+            self.proxy.invalidateFilter()
+        self._show_stats()
+
+    def _on_check_started(self):
+        # Determinate range: a busy indicator repaints for the whole check
+        self.progress_bar.setRange(0, max(1, len(self.core.packages)))
+        self.progress_bar.setValue(0)
+
+    def _advance_check_progress(self, pkg_name):
+        if self.update_in_progress:
+            self.progress_bar.setValue(self.progress_bar.value() + 1)
 
     @Slot()
     def on_update_check_finished(self):
+        self._flush_pending_updates()
         self.update_in_progress = False
         self.progress_section.hide()
         self.check_btn.setEnabled(True)
         self.refresh_tree()
 
     def on_operation_progress(self, data):
-        if 'operation' in self.active_dialogs:
-            self.active_dialogs['operation'].update_progress(data)
+        dialog = self.active_dialogs.get('operation')
+        # The dialog deletes itself when closed, possibly before pip finishes
+        if dialog is not None and shiboken6.isValid(dialog):
+            dialog.update_progress(data)
 
     def on_operation_completed(self, success, message):
         self._last_op_time = time.time()
@@ -819,18 +940,21 @@ class MainWindow(QMainWindow):
             action = getattr(dialog, 'action', None)
             del self.active_dialogs['operation']
         
+        if success:
+            # Installed distributions changed; drop parsed dependency lists
+            clear_dependency_cache()
+        
         if success and pkg_name:
             if action == 'uninstall':
                 # FIX: Immediately remove row for uninstall
-                for i in range(self.model.rowCount()):
-                    if self.model.item(i, 0).text() == pkg_name:
-                        self.model.removeRow(i)
-                        self.status_bar.showMessage(f"✗ {pkg_name} removed successfully", 5000)
-                        # Reset stats
-                        self.core.refresh_packages_data() # Update internal counts
-                        # Update stats label manually or via signal? 
-                        # Ideally refresh_packages_data returns new counts, but we can just trigger a silent background reload
-                        break
+                row_idx = self._row_of(pkg_name)
+                if row_idx >= 0:
+                    self.model.removeRow(row_idx)
+                    self._row_index.pop(pkg_name, None)
+                    self._rendered_version = -1
+                    self.status_bar.showMessage(f"✗ {pkg_name} removed successfully", 5000)
+                    # Reset stats (core already dropped the package)
+                    self._do_do_refresh_stats()
                 self.load_packages(force_refresh=True) # Sync fully in background
             elif action == 'install':
                  # FIX: Skip redundant load_packages for install (handled via _update_after_install)
@@ -839,9 +963,9 @@ class MainWindow(QMainWindow):
                  self.status_bar.showMessage(f"✅ {pkg_name} installed successfully", 5000)
             else:
                 # Update: Use check_single_package to verify new version
+                # (its callback runs on a worker thread, so hand off via signal)
                 def on_single_check_done(s, m):
-                    self.refresh_tree()
-                    self.status_bar.showMessage(f"✓ {pkg_name} updated successfully", 5000)
+                    self.package_rechecked.emit(pkg_name)
                 
                 self.core.check_single_package(pkg_name, callback=on_single_check_done)
                 # Also reload packages list in background to ensure consistency
@@ -851,12 +975,21 @@ class MainWindow(QMainWindow):
             self.load_packages(force_refresh=True)
             self.refresh_tree()
 
+    def _on_package_rechecked(self, pkg_name):
+        self.refresh_tree()
+        self.status_bar.showMessage(f"✓ {pkg_name} updated successfully", 5000)
+
     def on_package_double_clicked(self, index):
         # Handle proxy model mapping
         source_index = self.proxy.mapToSource(index)
         pkg = self.model.item(source_index.row(), 0).data(Qt.UserRole)
         
-        dialog = PackageDetailsDialog(self, pkg, self.core, self.env_manager)
+        # One details dialog is kept and repointed instead of rebuilt per double-click
+        dialog = self._details_dialog
+        if dialog is None:
+            dialog = self._details_dialog = PackageDetailsDialog(self, pkg, self.core, self.env_manager)
+        else:
+            dialog.set_package(pkg)
         res = dialog.exec()
         
         # Handle custom return codes
@@ -870,6 +1003,8 @@ class MainWindow(QMainWindow):
 
     def perform_package_action(self, name, ver, action):
         dialog = ProgressDialog(self, name, action, self.env_manager.current_env)
+        # Free the dialog (log, timer) when closed instead of keeping it parented to the window
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
         self.active_dialogs['operation'] = dialog
         dialog.show()
         if action == "uninstall": self.core.uninstall_package(name)
@@ -879,51 +1014,75 @@ class MainWindow(QMainWindow):
         dlg = SearchDialog(self, self.core)
         dlg.exec()
     
+    def _on_search_text_changed(self, _text):
+        self._search_debounce_timer.start(200)
+
     def _apply_search_to_proxy(self):
         """Apply search filter to proxy model"""
         search_text = self.search_input.text().strip().lower()
-        self.proxy.search_term = search_text
+        if not search_text:
+            self.proxy.search_names = None
+            self.proxy.invalidateFilter()
+            self.status_bar.clearMessage()
+            return
+        
+        # Match names in the core's task pool; the proxy only does set lookups
+        def deliver(results):
+            self.search_results_ready.emit(search_text, {p["name"] for p in results})
+        self.core.search_packages(search_text, ui_callback=deliver)
+
+    def _on_search_results(self, search_text, names):
+        if search_text != self.search_input.text().strip().lower():
+            return  # Superseded by a newer keystroke
+        self.proxy.search_names = names
         self.proxy.invalidateFilter()
         
         # Update status
-        if search_text:
-            visible_count = self.proxy.rowCount()
-            self.status_bar.showMessage(f"🔍 Found {visible_count} packages matching '{search_text}'", 3000)
-        else:
-            self.status_bar.showMessage("", 100)
+        visible_count = self.proxy.rowCount()
+        self.status_bar.showMessage(f"🔍 Found {visible_count} packages matching '{search_text}'", 3000)
 
     def refresh_environments(self):
         self.environment_combo.blockSignals(True)
-        self.environment_combo.clear()
-        self.environment_combo.addItem("Scanning environments...", None)
+        if self._env_entries is None:
+            self.environment_combo.clear()
+            self.environment_combo.addItem("Scanning environments...", None)
+        else:
+            # Keep the current list visible; it is only rebuilt if the scan changes it
+            self.status_bar.showMessage("Scanning environments...", 3000)
         self.environment_combo.setEnabled(False)
         
         # Async Refresh to prevent UI freeze
-        def on_refresh_finished():
-            self.environment_combo.clear()
-            envs = self.env_manager.all_environments
-            current = self.env_manager.get_python_command()
-            
-            for i, env in enumerate(envs):
-                self.environment_combo.addItem(env['display'], env['python_path'])
-                if env['python_path'] == current: 
-                    self.environment_combo.setCurrentIndex(i)
-            
-            self.environment_combo.setEnabled(True)
-            self.environment_combo.blockSignals(False)
-            
-        # Use GenericWorker for async execution
         self.env_worker = GenericWorker(self.env_manager.refresh)
-        self.env_worker.finished.connect(lambda _: on_refresh_finished())
-        self.env_worker.error.connect(lambda e: [
-             self.environment_combo.clear(),
-             self.environment_combo.addItem("Error scanning environments", None),
-             self.environment_combo.setEnabled(True),
-             self.environment_combo.blockSignals(False),
-             logger.error(f"Env refresh error: {e}")
-        ])
+        self.env_worker.finished.connect(self._on_env_refresh_finished)
+        self.env_worker.error.connect(self._on_env_refresh_error)
         self.env_worker.start()
 
+    def _on_env_refresh_finished(self, _result=None):
+        envs = self.env_manager.all_environments
+        current = self.env_manager.get_python_command()
+        entries = tuple((env['display'], env['python_path']) for env in envs)
+        
+        if entries != self._env_entries:
+            self.environment_combo.clear()
+            for display, python_path in entries:
+                self.environment_combo.addItem(display, python_path)
+            self._env_entries = entries
+        
+        for i, (_, python_path) in enumerate(entries):
+            if python_path == current: 
+                self.environment_combo.setCurrentIndex(i)
+        
+        self.environment_combo.setEnabled(True)
+        self.environment_combo.blockSignals(False)
+
+    def _on_env_refresh_error(self, error):
+        logger.error("Env refresh error: %s", error)
+        self._env_entries = None
+        self.environment_combo.clear()
+        self.environment_combo.addItem("Error scanning environments", None)
+        self.environment_combo.setEnabled(True)
+        self.environment_combo.blockSignals(False)
+
     def on_environment_changed(self, index):
         if index < 0 or index >= self.environment_combo.count():
             return
@@ -966,7 +1125,7 @@ class MainWindow(QMainWindow):
             # 4. Load with safe callback checking generation
             def safe_refresh():
                 if self._ui_generation != current_gen:
-                    logger.debug(f"Skipping stale UI refresh (gen {current_gen} vs current {self._ui_generation})")
+                    logger.debug("Skipping stale UI refresh (gen %s vs current %s)", current_gen, self._ui_generation)
                     return
                 # Must invoke execution on Main Thread for UI updates
                 QMetaObject.invokeMethod(self, "on_packages_loaded", Qt.QueuedConnection)
@@ -5,15 +5,24 @@ import subprocess
 import sys
 import re
 import os
+import json
 import time
 import threading
 import ssl
 import urllib.request
 import urllib.error
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any, Optional
 from datetime import datetime, timedelta
 
 
+# Optional faster JSON decoder for PyPI and pip output (accepts bytes directly)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # Production logging
 from .system import get_detector
 detector = get_detector()
@@ -47,21 +56,35 @@ MAX_REQUEST_ATTEMPTS = 3
 REQUEST_RETRY_DELAY = 2
 
 
+_HIDDEN_STARTUPINFO = None
+
+
 def get_subprocess_kwargs() -> Dict[str, Any]:
     """
     Get kwargs to hide console window on Windows EXE.
     Use with subprocess.run(..., **get_subprocess_kwargs())
     """
+    global _HIDDEN_STARTUPINFO
     kwargs = {}
     if sys.platform == 'win32':
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        startupinfo.wShowWindow = subprocess.SW_HIDE
-        kwargs['startupinfo'] = startupinfo
+        # subprocess copies STARTUPINFO before use, so one instance is shared
+        if _HIDDEN_STARTUPINFO is None:
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = subprocess.SW_HIDE
+            _HIDDEN_STARTUPINFO = startupinfo
+        kwargs['startupinfo'] = _HIDDEN_STARTUPINFO
         kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
     return kwargs
 
 
+def run_hidden(*args, **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run() that hides the console window on Windows."""
+    for key, value in get_subprocess_kwargs().items():
+        kwargs.setdefault(key, value)
+    return subprocess.run(*args, **kwargs)
+
+
 def validate_pip_base_command(pip_cmd: List[str]) -> Tuple[bool, str]:
     """Validate that the pip command base is safe."""
     if not pip_cmd or not isinstance(pip_cmd, list):
@@ -104,7 +127,7 @@ def validate_package_name(name: str) -> Tuple[bool, Optional[str]]:
         if not pattern.match(name):
             return False, f"Invalid package name format: {name[:50]}"
     except re.error as e:
-        logger.error(f"Regex error: {e}")
+        logger.error("Regex error: %s", e)
         return False, "Internal validation error"
     
     return True, None
@@ -157,17 +180,17 @@ def sanitize_pip_args(args: List[str]) -> List[str]:
 def safe_regex_search(pattern: str, text: str) -> Optional[re.Match]:
     """Safe regex search with size limits."""
     if not text or len(text) > 10000:
-        logger.warning(f"Text too long for regex search: {len(text)} chars")
+        logger.warning("Text too long for regex search: %s chars", len(text))
         return None
     
     try:
         compiled = re.compile(pattern, re.DOTALL)
         return compiled.search(text)
     except re.error as e:
-        logger.error(f"Regex error: {e}")
+        logger.error("Regex error: %s", e)
         return None
     except Exception as e:
-        logger.error(f"Unexpected regex error: {e}")
+        logger.error("Unexpected regex error: %s", e)
         return None
 
 
@@ -202,12 +225,12 @@ def run_pip_safe(args: List[str], timeout: int = 300, pip_cmd: Optional[List[str
                     raise ValueError(f"pip_cmd[{i}] too long (max 500 characters)")
             
             cmd = pip_cmd + sanitized_args
-            logger.info(f"Executing pip (custom): {' '.join(pip_cmd[:3])} {safe_log}")
+            logger.info("Executing pip (custom): %s %s", ' '.join(pip_cmd[:3]), safe_log)
         else:
             cmd = [detector.get_actual_python_executable(), "-m", "pip"] + sanitized_args
-            logger.info(f"Executing pip (system): {safe_log}")
+            logger.info("Executing pip (system): %s", safe_log)
         
-        result = subprocess.run(
+        result = run_hidden(
             cmd,
             capture_output=True,
             text=True,
@@ -215,13 +238,12 @@ def run_pip_safe(args: List[str], timeout: int = 300, pip_cmd: Optional[List[str
             check=False,
             shell=False,
             encoding='utf-8',
-            errors='replace',
-            **get_subprocess_kwargs()  # Hide CMD window on Windows
+            errors='replace'
         )
         
         if result.returncode != 0:
             error_msg = result.stderr[:500] if result.stderr else "Unknown error"
-            logger.error(f"Pip failed (code {result.returncode}): {error_msg}")
+            logger.error("Pip failed (code %s): %s", result.returncode, error_msg)
             
             # User-friendly errors
             if "PermissionError" in error_msg or "permission denied" in error_msg.lower():
@@ -234,18 +256,18 @@ def run_pip_safe(args: List[str], timeout: int = 300, pip_cmd: Optional[List[str
                 raise Exception(f"Command failed: {error_msg[:200]}")
         
         if result.stdout:
-            logger.debug(f"Pip output: {result.stdout[:200]}...")
+            logger.debug("Pip output: %s...", result.stdout[:200])
         
         return result.stdout
         
     except subprocess.TimeoutExpired:
-        logger.error(f"Pip timeout after {timeout}s")
+        logger.error("Pip timeout after %ss", timeout)
         raise Exception(f"Operation timed out after {timeout} seconds")
     except FileNotFoundError:
         logger.error("Python/pip not found")
         raise Exception("Python/pip not found - ensure Python is installed")
     except Exception as e:
-        logger.exception(f"Unexpected pip error")
+        logger.exception("Unexpected pip error")
         raise
 
 
@@ -290,10 +312,10 @@ def run_pip_with_real_progress(args: List[str], progress_callback=None,
                     raise ValueError(f"pip_cmd[{i}] too long (max 500 characters)")
             
             cmd = pip_cmd + sanitized_args
-            logger.info(f"Executing pip with progress (custom): {' '.join(pip_cmd[:3])} {safe_log}")
+            logger.info("Executing pip with progress (custom): %s %s", ' '.join(pip_cmd[:3]), safe_log)
         else:
             cmd = [detector.get_actual_python_executable(), "-m", "pip"] + sanitized_args
-            logger.info(f"Executing pip with progress (system): {safe_log}")
+            logger.info("Executing pip with progress (system): %s", safe_log)
         
         # Send start notification
         if progress_callback:
@@ -349,7 +371,7 @@ def run_pip_with_real_progress(args: List[str], progress_callback=None,
                                     'is_stderr': is_stderr
                                 })
             except Exception as e:
-                logger.error(f"Stream read error: {e}")
+                logger.error("Stream read error: %s", e)
         
         # Start reader threads
         stdout_thread = threading.Thread(
@@ -372,7 +394,7 @@ def run_pip_with_real_progress(args: List[str], progress_callback=None,
             stderr_thread.join(timeout=2)
             
             error_msg = f"Operation timed out after {timeout} seconds"
-            logger.error(f"Pip timeout: {error_msg}")
+            logger.error("Pip timeout: %s", error_msg)
             
             if progress_callback:
                 progress_callback({'type': 'error', 'message': error_msg})
@@ -387,7 +409,7 @@ def run_pip_with_real_progress(args: List[str], progress_callback=None,
         # Check exit code
         if return_code != 0:
             error_msg = '\n'.join(all_output[-10:]) if all_output else "Unknown error"
-            logger.error(f"Pip failed (code {return_code}): {error_msg[:200]}")
+            logger.error("Pip failed (code %s): %s", return_code, error_msg[:200])
             
             if progress_callback:
                 progress_callback({
@@ -414,7 +436,7 @@ def run_pip_with_real_progress(args: List[str], progress_callback=None,
                 'output_lines': len(all_output)
             })
         
-        logger.info(f"Pip completed in {timeout}s")
+        logger.info("Pip completed in %ss", timeout)
         return True, "Successfully completed", all_output
         
     except FileNotFoundError:
@@ -425,7 +447,7 @@ def run_pip_with_real_progress(args: List[str], progress_callback=None,
         return False, error_msg, []
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
-        logger.exception(f"Unexpected pip error")
+        logger.exception("Unexpected pip error")
         if progress_callback:
             progress_callback({'type': 'error', 'message': error_msg})
         return False, error_msg, []
@@ -488,7 +510,7 @@ def parse_pip_output(line: str) -> Optional[Dict[str, Any]]:
         return None
         
     except Exception as e:
-        logger.debug(f"Parse error: {e}")
+        logger.debug("Parse error: %s", e)
         return None
 
 
@@ -507,6 +529,9 @@ def convert_to_mb(value: float, unit: str) -> float:
         return value / (1024 * 1024)
 
 
+_secure_ssl_context = None
+
+
 def create_secure_ssl_context() -> ssl.SSLContext:
     """Create SSL context with modern security."""
     try:
@@ -517,31 +542,39 @@ def create_secure_ssl_context() -> ssl.SSLContext:
         context.set_ciphers('ECDHE+AESGCM:ECDHE+CHACHA20:DHE+AESGCM:DHE+CHACHA20')
         return context
     except Exception as e:
-        logger.warning(f"SSL context error: {e}")
+        logger.warning("SSL context error: %s", e)
         context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
         context.check_hostname = True
         context.verify_mode = ssl.CERT_REQUIRED
         return context
 
 
+def _shared_ssl_context() -> ssl.SSLContext:
+    """One secure context for all requests (loading the CA bundle is the expensive part)."""
+    global _secure_ssl_context
+    if _secure_ssl_context is None:
+        _secure_ssl_context = create_secure_ssl_context()
+    return _secure_ssl_context
+
+
 def safe_urlopen(url: str, timeout: int = 10, headers=None, max_attempts: int = MAX_REQUEST_ATTEMPTS):
     """Safely open URL with retry logic and error handling."""
     if not url or not isinstance(url, str):
-        logger.error(f"Invalid URL: {url}")
+        logger.error("Invalid URL: %s", url)
         return None
     
     if len(url) > MAX_URL_LENGTH:
-        logger.error(f"URL too long: {len(url)} characters")
+        logger.error("URL too long: %s characters", len(url))
         return None
     
     for attempt in range(max_attempts):
         try:
             parsed = urllib.parse.urlparse(url)
             if not parsed.scheme or parsed.scheme not in ['http', 'https']:
-                logger.error(f"Invalid URL scheme: {url}")
+                logger.error("Invalid URL scheme: %s", url)
                 return None
             
-            context = create_secure_ssl_context()
+            context = _shared_ssl_context()
             
             req_headers = {
                 'User-Agent': 'PyScope',
@@ -559,13 +592,13 @@ def safe_urlopen(url: str, timeout: int = 10, headers=None, max_attempts: int =
             if attempt < max_attempts - 1:
                 time.sleep(REQUEST_RETRY_DELAY)
                 continue
-            logger.error(f"HTTP error: {e}")
+            logger.error("HTTP error: %s", e)
             return None
         except Exception as e:
             if attempt < max_attempts - 1:
                 time.sleep(REQUEST_RETRY_DELAY)
                 continue
-            logger.error(f"URL open error: {e}")
+            logger.error("URL open error: %s", e)
             return None
     
     return None
@@ -588,7 +621,7 @@ def safe_string_truncate(text: str, max_length: int) -> str:
         return text
     
     if len(text) > max_length:
-        logger.warning(f"Truncating string from {len(text)} to {max_length}")
+        logger.warning("Truncating string from %s to %s", len(text), max_length)
         return text[:max_length]
     
     return text
@@ -597,7 +630,7 @@ def safe_string_truncate(text: str, max_length: int) -> str:
 def get_python_version(python_path: str) -> str:
     """Get Python version from executable."""
     try:
-        result = subprocess.run(
+        result = run_hidden(
             [python_path, "--version"],
             capture_output=True,
             text=True,
@@ -610,14 +643,14 @@ def get_python_version(python_path: str) -> str:
         else:
             return "Unknown"
     except Exception as e:
-        logger.error(f"Failed to get Python version for {python_path}: {e}")
+        logger.error("Failed to get Python version for %s: %s", python_path, e)
         return "Unknown"
 
 
 def get_pip_version(pip_cmd: List[str]) -> str:
     """Get pip version from command."""
     try:
-        result = subprocess.run(
+        result = run_hidden(
             pip_cmd + ["--version"],
             capture_output=True,
             text=True,
@@ -633,14 +666,14 @@ def get_pip_version(pip_cmd: List[str]) -> str:
         else:
             return "Unknown"
     except Exception as e:
-        logger.error(f"Failed to get pip version: {e}")
+        logger.error("Failed to get pip version: %s", e)
         return "Unknown"
 
 
 def validate_python_executable(python_path: str) -> bool:
     """Validate if a Python executable is valid."""
     try:
-        result = subprocess.run(
+        result = run_hidden(
             [python_path, "-c", "import sys; print(sys.version[:5])"],
             capture_output=True,
             text=True,
@@ -686,7 +719,7 @@ def get_environment_info(pip_cmd: Optional[List[str]] = None) -> Dict[str, Any]:
             "pip_command": pip_cmd or [detector.get_actual_python_executable(), "-m", "pip"]
         }
     except Exception as e:
-        logger.error(f"Failed to get environment info: {e}")
+        logger.error("Failed to get environment info: %s", e)
         return {
             "python_path": detector.get_actual_python_executable(),
             "python_version": "Unknown",
@@ -700,7 +733,7 @@ def check_pip_available(pip_cmd: Optional[List[str]] = None) -> bool:
     """Check if pip is available in the current environment."""
     try:
         cmd = pip_cmd or [detector.get_actual_python_executable(), "-m", "pip"]
-        result = subprocess.run(
+        result = run_hidden(
             cmd + ["--version"],
             capture_output=True,
             text=True,
@@ -727,6 +760,21 @@ def get_python_environment_list() -> List[Dict[str, Any]]:
 
 # --- From version_comparator.py ---
 
+# Separators and digit runs for the non-PEP 440 fallback comparison
+_VERSION_NON_NUMERIC_RE = re.compile(r'[a-zA-Z+-]')
+_VERSION_DIGITS_RE = re.compile(r'\d+')
+
+
+@lru_cache(maxsize=2048)
+def _parse_pep440(version: str):
+    """Parsed packaging Version, or None if the string is not PEP 440 (cached across checks)."""
+    from packaging.version import Version, InvalidVersion
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
+
+
 class VersionComparator:
     """Compares versions using Python packaging standards."""
     
@@ -774,12 +822,12 @@ class VersionComparator:
                     return ("same", {"v1": str(ver1), "v2": str(ver2)})
                     
             except InvalidVersion as e:
-                logger.warning(f"Invalid version format: '{v1}' or '{v2}' - {e}")
+                logger.warning("Invalid version format: '%s' or '%s' - %s", v1, v2, e)
                 # Fallback to simple comparison
                 return self._compare_simple(v1, v2)
                 
         except Exception as e:
-            logger.error(f"Error in version comparison: {e}")
+            logger.error("Error in version comparison: %s", e)
             return ("error", str(e))
     
     def _compare_simple(self, v1: str, v2: str) -> Tuple[str, Optional[Any]]:
@@ -804,18 +852,18 @@ class VersionComparator:
             return ("same", {"v1_parts": v1_parts, "v2_parts": v2_parts})
             
         except Exception as e:
-            logger.error(f"Error in simple comparison: {e}")
+            logger.error("Error in simple comparison: %s", e)
             return ("error", str(e))
     
     def _parse_version_parts(self, version: str) -> list:
         """Parse version string into numeric parts."""
         # Replace non-numeric with dot
-        clean = re.sub(r'[a-zA-Z+-]', '.', str(version))
+        clean = _VERSION_NON_NUMERIC_RE.sub('.', str(version))
         parts = []
         
         for part in clean.split('.'):
             # Extract numbers only
-            match = re.search(r'\d+', part)
+            match = _VERSION_DIGITS_RE.search(part)
             if match:
                 parts.append(int(match.group()))
             else:
@@ -834,6 +882,13 @@ class VersionComparator:
         
         if current == latest:
             return False
+        
+        if self._packaging_available:
+            # Fast path: reuse parsed versions instead of building comparison details
+            current_version = _parse_pep440(current)
+            latest_version = _parse_pep440(latest)
+            if current_version is not None and latest_version is not None:
+                return current_version < latest_version
             
         try:
             result, _ = self.compare(current, latest)
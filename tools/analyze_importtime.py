@@ -0,0 +1,44 @@
+"""
+Summarize a ``python -X importtime`` log.
+Usage: python tools/analyze_importtime.py [importtime.log] [--top N] [--prefix pyscope]
+"""
+import argparse
+import sys
+
+
+def parse(lines):
+    """Yield (module, self_us, cumulative_us, depth) for each import line."""
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        except ValueError:
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        yield name.strip(), int(self_us), int(cumulative_us), depth
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("log", nargs="?", default="importtime.log")
+    parser.add_argument("--top", type=int, default=25, help="rows to show")
+    parser.add_argument("--prefix", default="", help="only modules starting with this")
+    args = parser.parse_args()
+
+    with open(args.log, encoding="utf-8", errors="replace") as f:
+        entries = [e for e in parse(f) if e[0].startswith(args.prefix)]
+    if not entries:
+        print(f"No import time entries in {args.log}")
+        return 1
+
+    total = sum(e[1] for e in entries)
+    print(f"{len(entries)} modules, {total / 1000:.1f} ms self time\n")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, self_us, cumulative_us, depth in sorted(entries, key=lambda e: e[2], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())